@@ -15,7 +15,7 @@ import uuid
 import numpy as np
 
 # Import modules
-from gemini_intagration import analyze_image_with_gemini
+from gemini_intagration import analyze_image_with_gemini, analyze_images_batch_with_gemini
 from pdf_report_generator import generate_pdf_report
 from video_pdf_generator import generate_video_pdf_report
 from video_processor import VideoProcessor, save_uploaded_video, cleanup_temp_file, format_timestamp
@@ -291,7 +291,9 @@ if app_mode == "🎥 New Video Inspection":
                 analysis_results = processor.analyze_video_with_ai(
                     temp_video_path,
                     analyze_image_with_gemini,
-                    progress_callback=update_progress
+                    progress_callback=update_progress,
+                    batch_analyzer=analyze_images_batch_with_gemini,
+                    video_info=video_info
                 )
 
                 progress_text.empty()
@@ -371,9 +373,9 @@ if app_mode == "🎥 New Video Inspection":
                 for frame_analysis in analysis_results.get('frame_analyses', [])[:10]:  # Top 10 frames
                     if len(frame_analysis['detections']) > 0:
                         # Find matching frame
-                        for frame_img, timestamp, frame_num in frames_data:
+                        for frame_rgb, timestamp, frame_num in frames_data:
                             if frame_num == frame_analysis['frame_number']:
-                                key_frames.append((frame_img.copy(), timestamp, frame_analysis['detections']))
+                                key_frames.append((Image.fromarray(frame_rgb), timestamp, frame_analysis['detections']))
                                 break
 
                 st.session_state.video_key_frames = key_frames
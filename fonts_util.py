@@ -0,0 +1,88 @@
+"""
+Unicode font discovery for Defactra AI PDFs
+Finds and registers Malayalam/Hindi TrueType fonts with ReportLab
+"""
+
+from functools import lru_cache
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+import os
+
+# Common font locations
+FONT_PATHS = [
+    '/usr/share/fonts/truetype/noto/',
+    '/usr/share/fonts/truetype/liberation/',
+    '/usr/share/fonts/truetype/dejavu/',
+    '/usr/share/fonts/truetype/freefont/',
+    '/usr/local/share/fonts/',
+]
+
+# Font files to try per language, in priority order
+LANGUAGE_FONTS = {
+    'malayalam': [
+        'NotoSansMalayalam-Regular.ttf',
+        'NotoSansMalayalam.ttf',
+        'Meera-Regular.ttf',
+        'FreeSerif.ttf',  # Has some Unicode support
+    ],
+    'hindi': [
+        'NotoSansDevanagari-Regular.ttf',
+        'NotoSansDevanagari.ttf',
+        'Lohit-Devanagari.ttf',
+        'FreeSerif.ttf',  # Has some Unicode support
+    ],
+}
+
+
+@lru_cache(maxsize=1)
+def register_unicode_fonts():
+    """
+    Register the first working Unicode font for each language
+
+    Fonts are registered under the capitalized language name ('Malayalam',
+    'Hindi'). Font directories don't change while the app is running, so the
+    scan runs once per process; later calls return the cached result, which
+    callers must not modify.
+
+    Returns:
+        Dict mapping language code to the registered font path
+    """
+    fonts_registered = {}
+
+    try:
+        # List each directory once; candidates are then plain set lookups
+        # instead of one stat call per (directory, file) pair
+        dir_entries = {}
+        for font_dir in FONT_PATHS:
+            try:
+                with os.scandir(font_dir) as entries:
+                    dir_entries[font_dir] = {entry.name for entry in entries}
+            except OSError:
+                continue
+
+        for lang, font_files in LANGUAGE_FONTS.items():
+            font_name = lang.capitalize()
+            candidates = [
+                os.path.join(font_dir, font_file)
+                for font_dir, names in dir_entries.items()
+                for font_file in font_files
+                if font_file in names
+            ]
+
+            # The first font that registers wins for its language
+            for full_path in candidates:
+                try:
+                    # TTFont always embeds subsets holding only the glyphs
+                    # drawn, never the whole Indic font file
+                    pdfmetrics.registerFont(TTFont(font_name, full_path))
+                except Exception as e:
+                    print(f"⚠️  Failed to register {os.path.basename(full_path)}: {e}")
+                    continue
+                fonts_registered[lang] = full_path
+                print(f"✅ {font_name} font registered: {os.path.basename(full_path)}")
+                break
+
+    except Exception as e:
+        print(f"⚠️ Font registration warning: {e}")
+
+    return fonts_registered
@@ -14,41 +14,18 @@ Get your API key:
 from google import genai
 from google.genai import types
 import json
+import logging
 import streamlit as st
 from PIL import Image
 import io
 
+logger = logging.getLogger(__name__)
 
-def analyze_image_with_gemini(image, api_key=None):
-    """
-    FREE AI-Powered Property Inspection using Google Gemini Vision API
-
-    Args:
-        image: PIL Image object
-        api_key: Optional API key (if not in secrets)
-
-    Returns:
-        dict: Analysis results with defects, scores, and assessments
-    """
-
-    # Get API key from secrets or parameter
-    if api_key is None:
-        try:
-            api_key = st.secrets["gemini"]["api_key"]
-        except Exception:
-            st.error("❌ Gemini API key not found. Please add it to .streamlit/secrets.toml")
-            st.info("Get your FREE API key at: https://aistudio.google.com/app/apikey")
-            return get_fallback_analysis(image)
-
-    # Configure Gemini client
-    try:
-        client = genai.Client(api_key=api_key)
-    except Exception as e:
-        st.error(f"❌ Failed to initialize Gemini API: {e}")
-        return get_fallback_analysis(image)
 
-    # Comprehensive inspection prompt
-    system_prompt = """You are an expert property inspector AI with extensive experience in building inspections, construction, and property maintenance. Analyze this image in extreme detail.
+# Comprehensive inspection prompt. It is identical for every image and is sent
+# ahead of the image bytes, so repeat requests share a stable prefix that
+# Gemini's implicit context cache can match.
+VISION_SYSTEM_PROMPT = """You are an expert property inspector AI with extensive experience in building inspections, construction, and property maintenance. Analyze this image in extreme detail.
 
 YOUR TASKS:
 
@@ -161,35 +138,124 @@ RETURN ONLY VALID JSON - NO MARKDOWN, NO CODE BLOCKS, NO PREAMBLE:
 
 If no defects visible, return empty defects array but still provide overall assessment noting that no visible issues were found (but hidden problems may exist)."""
 
+
+@st.cache_resource(show_spinner=False)
+def get_gemini_client(api_key):
+    """
+    Get a Gemini client for the API key, created once and reused across
+    Streamlit reruns and sessions. A different key builds a new client.
+    """
+    return genai.Client(api_key=api_key)
+
+
+def _encode_for_gemini(image, max_edge=1024):
+    """
+    Encode an image for upload as JPEG, downscaled to max_edge
+
+    Gemini resizes large inputs internally, so sending full-resolution phone
+    photos only adds upload time. Bytes are taken to be JPEG data that is
+    already encoded, such as video frames, and are sent as they are.
+    """
+    if isinstance(image, bytes):
+        return image
+
+    if max(image.size) > max_edge:
+        image = image.copy()
+        image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+    img_byte_arr = io.BytesIO()
+    image.convert('RGB').save(img_byte_arr, format='JPEG', quality=85)
+    return img_byte_arr.getvalue()
+
+
+def _strip_code_fence(response_text):
+    """Remove markdown code fences Gemini sometimes wraps around JSON"""
+    if "```json" in response_text:
+        response_text = response_text.split("```json")[1].split("```")[0].strip()
+    elif "```" in response_text:
+        response_text = response_text.split("```")[1].split("```")[0].strip()
+
+    # Remove any leading/trailing whitespace or newlines
+    return response_text.strip()
+
+
+def _finalize_analysis(result):
+    """Add defects_summary and rename defects for a parsed analysis dict"""
+    # Add defects_summary if property image
+    if result.get("is_property", False):
+        if "defects" in result:
+            result["defects_summary"] = {
+                "critical": len([d for d in result["defects"] if d.get('severity') == 'critical']),
+                "high": len([d for d in result["defects"] if d.get('severity') == 'high']),
+                "medium": len([d for d in result["defects"] if d.get('severity') == 'medium']),
+                "low": len([d for d in result["defects"] if d.get('severity') == 'low']),
+                "total": len(result["defects"])
+            }
+
+            # Rename "defects" to "detections" for compatibility with app
+            result["detections"] = result.pop("defects")
+        else:
+            result["detections"] = []
+            result["defects_summary"] = {"critical": 0, "high": 0, "medium": 0, "low": 0, "total": 0}
+
+    return result
+
+
+def analyze_image_with_gemini(image, api_key=None):
+    """
+    FREE AI-Powered Property Inspection using Google Gemini Vision API
+
+    Args:
+        image: PIL Image object, or JPEG bytes
+        api_key: Optional API key (if not in secrets)
+
+    Returns:
+        dict: Analysis results with defects, scores, and assessments
+    """
+
+    # Get API key from secrets or parameter
+    if api_key is None:
+        try:
+            api_key = st.secrets["gemini"]["api_key"]
+        except Exception:
+            st.error("❌ Gemini API key not found. Please add it to .streamlit/secrets.toml")
+            st.info("Get your FREE API key at: https://aistudio.google.com/app/apikey")
+            return get_fallback_analysis(image)
+
+    # Configure Gemini client
+    try:
+        client = get_gemini_client(api_key)
+    except Exception as e:
+        st.error(f"❌ Failed to initialize Gemini API: {e}")
+        return get_fallback_analysis(image)
+
     try:
-        # Convert PIL Image to bytes
-        img_byte_arr = io.BytesIO()
-        image.save(img_byte_arr, format='PNG')
-        img_byte_arr = img_byte_arr.getvalue()
+        # Convert to compact JPEG bytes
+        img_byte_arr = _encode_for_gemini(image)
 
         # Use Gemini 2.5 Flash (latest and fastest)
         response = client.models.generate_content(
             model='gemini-2.5-flash',
             contents=[
-                system_prompt,
+                VISION_SYSTEM_PROMPT,
                 types.Part.from_bytes(
                     data=img_byte_arr,
-                    mime_type="image/png"
+                    mime_type="image/jpeg"
                 )
             ]
         )
 
+        # Log implicit cache hits on the shared prompt prefix
+        usage = getattr(response, 'usage_metadata', None)
+        cached_tokens = getattr(usage, 'cached_content_token_count', None)
+        if cached_tokens:
+            logger.debug("Gemini prompt cache hit: %s tokens", cached_tokens)
+
         # Get response text
         response_text = response.text.strip()
 
         # Clean potential markdown formatting
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-
-        # Remove any leading/trailing whitespace or newlines
-        response_text = response_text.strip()
+        response_text = _strip_code_fence(response_text)
 
         # Parse JSON
         result = json.loads(response_text)
@@ -198,22 +264,7 @@ If no defects visible, return empty defects array but still provide overall asse
         if not isinstance(result, dict):
             raise ValueError("Response is not a dictionary")
 
-        # Add defects_summary if property image
-        if result.get("is_property", False):
-            if "defects" in result:
-                result["defects_summary"] = {
-                    "critical": len([d for d in result["defects"] if d.get('severity') == 'critical']),
-                    "high": len([d for d in result["defects"] if d.get('severity') == 'high']),
-                    "medium": len([d for d in result["defects"] if d.get('severity') == 'medium']),
-                    "low": len([d for d in result["defects"] if d.get('severity') == 'low']),
-                    "total": len(result["defects"])
-                }
-
-                # Rename "defects" to "detections" for compatibility with app
-                result["detections"] = result.pop("defects")
-            else:
-                result["detections"] = []
-                result["defects_summary"] = {"critical": 0, "high": 0, "medium": 0, "low": 0, "total": 0}
+        _finalize_analysis(result)
 
         return result
 
@@ -250,6 +301,63 @@ If no defects visible, return empty defects array but still provide overall asse
 
         return get_fallback_analysis(image)
 
+# Appended after VISION_SYSTEM_PROMPT when several frames share one request
+BATCH_PROMPT_SUFFIX = """
+
+MULTIPLE IMAGES:
+You will receive several images, each preceded by a "Frame N:" label. Apply the tasks above to every frame independently.
+RETURN ONLY A VALID JSON ARRAY containing exactly one result object per frame, in frame order, each object following the JSON format above."""
+
+
+def analyze_images_batch_with_gemini(images, api_key=None):
+    """
+    Analyze several images with a single Gemini request
+
+    One call amortizes the connection and prompt prefill over every image,
+    which suits bursts of video key frames. If the batched answer cannot be
+    matched to the images, each image is analyzed on its own instead.
+
+    Args:
+        images: List of PIL Image objects or JPEG bytes
+        api_key: Optional API key (if not in secrets)
+
+    Returns:
+        list: One analysis dict per image, in input order
+    """
+    if not images:
+        return []
+
+    # Get API key from secrets or parameter
+    if api_key is None:
+        try:
+            api_key = st.secrets["gemini"]["api_key"]
+        except Exception:
+            st.error("❌ Gemini API key not found. Please add it to .streamlit/secrets.toml")
+            return [get_fallback_analysis(image) for image in images]
+
+    try:
+        client = get_gemini_client(api_key)
+
+        contents = [VISION_SYSTEM_PROMPT, BATCH_PROMPT_SUFFIX]
+        for idx, image in enumerate(images, 1):
+            contents.append(f"Frame {idx}:")
+            contents.append(types.Part.from_bytes(data=_encode_for_gemini(image), mime_type="image/jpeg"))
+
+        response = client.models.generate_content(
+            model='gemini-2.5-flash',
+            contents=contents
+        )
+
+        results = json.loads(_strip_code_fence(response.text.strip()))
+        if not isinstance(results, list) or len(results) != len(images):
+            raise ValueError(f"expected a list of {len(images)} results")
+
+        return [_finalize_analysis(result) for result in results]
+
+    except Exception as e:
+        st.warning(f"⚠️ Batch analysis failed ({e}), analyzing frames one by one")
+        return [analyze_image_with_gemini(image, api_key) for image in images]
+
 
 def get_fallback_analysis(image):
     """
@@ -259,6 +367,9 @@ def get_fallback_analysis(image):
     import numpy as np
 
     try:
+        if isinstance(image, bytes):
+            image = Image.open(io.BytesIO(image))
+
         img_array = np.array(image)
         avg_brightness = np.mean(img_array)
 
@@ -294,7 +405,7 @@ def test_gemini_connection(api_key):
     Returns: (success: bool, message: str)
     """
     try:
-        client = genai.Client(api_key=api_key)
+        client = get_gemini_client(api_key)
 
         response = client.models.generate_content(
             model='gemini-2.5-flash',
@@ -6,83 +6,41 @@ FIXED: Reduced marker sizes for better balance
 """
 
 from PIL import Image, ImageDraw, ImageFont
+from reportlab.lib.utils import ImageReader
+from reportlab.platypus import Flowable
 import io
 
 
-def annotate_image_with_defects(image, defects, language='english'):
+# Define colors for severity levels (matching video module)
+SEVERITY_COLORS = {
+    'critical': '#DC2626',  # Red
+    'high': '#F59E0B',      # Orange
+    'medium': '#FCD34D',    # Yellow
+    'low': '#10B981'        # Green
+}
+
+SEVERITY_LABELS = {
+    'critical': 'CRITICAL',
+    'high': 'HIGH',
+    'medium': 'MEDIUM',
+    'low': 'LOW'
+}
+
+
+def layout_defects(defects):
     """
-    Annotate image with numbered defect markers ONLY
-    Returns: 1) Annotated image, 2) STRUCTURED legend data (not image)
+    Group defects into marker zones and build the structured legend data
+
+    The layout depends only on the defect list, so when the same defects are
+    drawn on several images it can be computed once and passed to
+    annotate_image_with_defects via its layout argument.
 
     Args:
-        image: PIL Image object
         defects: List of defect dictionaries with location and severity
-        language: Language for labels
 
     Returns:
-        Tuple of (annotated_image, legend_data)
-        - annotated_image: PIL Image with markers
-        - legend_data: List of dicts with defect details for professional rendering
+        Tuple of (location_zones, legend_data)
     """
-    # Create a copy to avoid modifying original
-    annotated = image.copy()
-    draw = ImageDraw.Draw(annotated)
-
-    # Define colors for severity levels (matching video module)
-    severity_colors = {
-        'critical': '#DC2626',  # Red
-        'high': '#F59E0B',      # Orange
-        'medium': '#FCD34D',    # Yellow
-        'low': '#10B981'        # Green
-    }
-
-    severity_labels = {
-        'critical': 'CRITICAL',
-        'high': 'HIGH',
-        'medium': 'MEDIUM',
-        'low': 'LOW'
-    }
-
-    # Try to load fonts - REDUCED SIZES
-    try:
-        # Reduced base size calculation for smaller markers
-        base_size = max(18, min(image.width, image.height) // 35)
-        marker_font = ImageFont.truetype("arial.ttf", base_size + 6)
-        watermark_font = ImageFont.truetype("arial.ttf", base_size + 8)
-    except:
-        try:
-            base_size = max(18, min(image.width, image.height) // 35)
-            marker_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", base_size + 6)
-            watermark_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", base_size + 8)
-        except:
-            marker_font = ImageFont.load_default()
-            watermark_font = ImageFont.load_default()
-
-    # Image dimensions
-    img_width, img_height = annotated.size
-
-    # If no defects, add a watermark to image only
-    if not defects:
-        watermark_text = "✓ No Major Defects Detected"
-        bbox = draw.textbbox((0, 0), watermark_text, font=watermark_font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-
-        x = (img_width - text_width) // 2
-        y = 30
-
-        padding = 20  # Reduced padding
-        draw.rectangle(
-            [x - padding, y - padding, x + text_width + padding, y + text_height + padding],
-            fill='#FFFFFF',
-            outline='#00FF99',
-            width=5  # Reduced border width
-        )
-        draw.text((x, y), watermark_text, fill='#000000', font=watermark_font)
-
-        # Return image and None for legend data
-        return annotated, None
-
     # Group defects by location keywords
     location_zones = {
         'top': [],
@@ -126,14 +84,86 @@ def annotate_image_with_defects(image, defects, language='english'):
                 'number': marker_number,
                 'name': defect_name,
                 'severity': severity,
-                'severity_label': severity_labels.get(severity, severity.upper()),
-                'severity_color': severity_colors.get(severity, '#808080'),
+                'severity_label': SEVERITY_LABELS.get(severity, severity.upper()),
+                'severity_color': SEVERITY_COLORS.get(severity, '#808080'),
                 'location': location_text,
                 'description': description,
                 'confidence': confidence
             })
             marker_number += 1
 
+    return location_zones, legend_data
+
+
+def annotate_image_with_defects(image, defects, language='english', layout=None, scale=1.0):
+    """
+    Annotate image with numbered defect markers ONLY
+    Returns: 1) Annotated image, 2) STRUCTURED legend data (not image)
+
+    Args:
+        image: PIL Image object
+        defects: List of defect dictionaries with location and severity
+        language: Language for labels
+        layout: Optional precomputed result of layout_defects(defects)
+        scale: Size of image relative to the original photo (see prescale_image);
+            marker geometry is multiplied by it so markers keep the same relative size
+
+    Returns:
+        Tuple of (annotated_image, legend_data)
+        - annotated_image: PIL Image with markers
+        - legend_data: List of dicts with defect details for professional rendering
+    """
+    # Create a copy to avoid modifying original
+    annotated = image.copy()
+    draw = ImageDraw.Draw(annotated)
+
+    def px(value):
+        # Pixel sizes below are tuned for the original photo resolution
+        return max(1, round(value * scale))
+
+    # Try to load fonts - REDUCED SIZES
+    # Reduced base size calculation for smaller markers
+    base_size = max(18, int(min(image.width, image.height) / scale) // 35)
+    try:
+        marker_font = ImageFont.truetype("arial.ttf", px(base_size + 6))
+        watermark_font = ImageFont.truetype("arial.ttf", px(base_size + 8))
+    except:
+        try:
+            marker_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", px(base_size + 6))
+            watermark_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", px(base_size + 8))
+        except:
+            marker_font = ImageFont.load_default()
+            watermark_font = ImageFont.load_default()
+
+    # Image dimensions
+    img_width, img_height = annotated.size
+
+    # If no defects, add a watermark to image only
+    if not defects:
+        watermark_text = "✓ No Major Defects Detected"
+        bbox = draw.textbbox((0, 0), watermark_text, font=watermark_font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+
+        x = (img_width - text_width) // 2
+        y = px(30)
+
+        padding = px(20)  # Reduced padding
+        draw.rectangle(
+            [x - padding, y - padding, x + text_width + padding, y + text_height + padding],
+            fill='#FFFFFF',
+            outline='#00FF99',
+            width=px(5)  # Reduced border width
+        )
+        draw.text((x, y), watermark_text, fill='#000000', font=watermark_font)
+
+        # Return image and None for legend data
+        return annotated, None
+
+    if layout is None:
+        layout = layout_defects(defects)
+    location_zones, legend_data = layout
+
     # ======================================
     # DRAW MARKERS ON IMAGE ONLY - REDUCED SIZES
     # ======================================
@@ -144,10 +174,10 @@ def annotate_image_with_defects(image, defects, language='english'):
         'left': (img_width // 6, img_height // 2),
         'right': (5 * img_width // 6, img_height // 2),
         'center': (img_width // 2, img_height // 2),
-        'corner': (img_width - 80, 80),  # Reduced from 120
+        'corner': (img_width - px(80), px(80)),  # Reduced from 120
         'wall': (img_width // 3, img_height // 2),
-        'ceiling': (img_width // 2, 80),  # Reduced from 120
-        'floor': (img_width // 2, img_height - 80)  # Reduced from 120
+        'ceiling': (img_width // 2, px(80)),  # Reduced from 120
+        'floor': (img_width // 2, img_height - px(80))  # Reduced from 120
     }
 
     for zone, zone_defects in location_zones.items():
@@ -158,32 +188,33 @@ def annotate_image_with_defects(image, defects, language='english'):
 
         for j, (defect_idx, defect) in enumerate(zone_defects):
             # Calculate position with spacing - REDUCED SPACING
-            offset = (j - len(zone_defects) // 2) * 70  # Reduced from 120
+            offset = (j - len(zone_defects) // 2) * px(70)  # Reduced from 120
             x = base_x + offset
-            y = base_y + (j * 35 if len(zone_defects) > 1 else 0)  # Reduced from 60
+            y = base_y + (j * px(35) if len(zone_defects) > 1 else 0)  # Reduced from 60
 
             # Ensure marker stays within image bounds
-            x = max(60, min(x, img_width - 60))  # Reduced from 100
-            y = max(60, min(y, img_height - 60))  # Reduced from 100
+            x = max(px(60), min(x, img_width - px(60)))  # Reduced from 100
+            y = max(px(60), min(y, img_height - px(60)))  # Reduced from 100
 
             severity = defect.get('severity', 'medium').lower()
-            color = severity_colors.get(severity, '#808080')
+            color = SEVERITY_COLORS.get(severity, '#808080')
             color_rgb = tuple(int(color[i:i+2], 16) for i in (1, 3, 5))
 
             # Draw SMALLER marker circle - SIGNIFICANTLY REDUCED
-            marker_radius = 28  # Reduced from 55 (almost half)
+            marker_radius = px(28)  # Reduced from 55 (almost half)
+            glow, border = px(5), px(3)
 
             # Outer white glow - REDUCED
             draw.ellipse(
-                [x - marker_radius - 5, y - marker_radius - 5,
-                 x + marker_radius + 5, y + marker_radius + 5],
+                [x - marker_radius - glow, y - marker_radius - glow,
+                 x + marker_radius + glow, y + marker_radius + glow],
                 fill='#FFFFFF'
             )
 
             # Black border - REDUCED
             draw.ellipse(
-                [x - marker_radius - 3, y - marker_radius - 3,
-                 x + marker_radius + 3, y + marker_radius + 3],
+                [x - marker_radius - border, y - marker_radius - border,
+                 x + marker_radius + border, y + marker_radius + border],
                 fill='#000000'
             )
 
@@ -201,8 +232,9 @@ def annotate_image_with_defects(image, defects, language='english'):
             text_height = bbox[3] - bbox[1]
 
             # Black outline - REDUCED thickness
-            for offset_x in [-2, -1, 0, 1, 2]:  # Reduced from -5 to 5
-                for offset_y in [-2, -1, 0, 1, 2]:  # Reduced from -5 to 5
+            outline = range(-px(2), px(2) + 1)
+            for offset_x in outline:  # Reduced from -5 to 5
+                for offset_y in outline:  # Reduced from -5 to 5
                     if offset_x != 0 or offset_y != 0:
                         draw.text(
                             (x - text_width // 2 + offset_x, y - text_height // 2 + offset_y),
@@ -225,6 +257,57 @@ def annotate_image_with_defects(image, defects, language='english'):
     return annotated, legend_data
 
 
+def _open_draft_copy(image, max_size):
+    """
+    Reopen a not-yet-decoded JPEG from its own file data with draft() applied
+
+    Returns None if image is not an undecoded JPEG with a readable file.
+    """
+    fp = getattr(image, 'fp', None)
+    if image.format != 'JPEG' or not image.tile or fp is None:
+        return None
+
+    try:
+        # Read the compressed bytes and put the caller's file position back
+        position = fp.tell()
+        fp.seek(0)
+        data = fp.read()
+        fp.seek(position)
+
+        reopened = Image.open(io.BytesIO(data))
+        reopened.draft(None, max_size)
+        return reopened
+    except Exception:
+        return None
+
+
+def prescale_image(image, max_size=(1200, 900)):
+    """
+    Shrink a photo before annotation so markers are drawn on fewer pixels
+
+    JPEGs that have not been decoded yet are reopened from their compressed
+    data and draft()ed, so libjpeg decodes straight at 1/2, 1/4 or 1/8 scale.
+    The caller's image is never modified. Pass the returned scale to
+    annotate_image_with_defects.
+
+    Args:
+        image: PIL Image object
+        max_size: Maximum working dimensions (width, height)
+
+    Returns:
+        Tuple of (scaled_image, scale)
+    """
+    width, height = image.size
+    if width <= max_size[0] and height <= max_size[1]:
+        return image, 1.0
+
+    source = _open_draft_copy(image, max_size) or image
+
+    scaled = source.copy()
+    scaled.thumbnail(max_size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+    return scaled, scaled.width / width
+
+
 def create_thumbnail(image, max_size=(800, 600)):
     """
     Create a thumbnail of the image for the PDF
@@ -234,13 +317,51 @@ def create_thumbnail(image, max_size=(800, 600)):
         max_size: Maximum dimensions (width, height)
 
     Returns:
-        PIL Image thumbnail
+        PIL Image thumbnail; the input image itself if it already fits
     """
+    # Nothing to shrink: skip the full-size copy
+    ratio = max(image.width / max_size[0], image.height / max_size[1])
+    if ratio <= 1:
+        return image
+
     img_copy = image.copy()
-    img_copy.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+    # BILINEAR is visually indistinguishable from LANCZOS for small reductions
+    # and much cheaper (especially with pillow-simd); keep LANCZOS for big ones
+    if ratio <= 2:
+        resample = Image.Resampling.BILINEAR
+    else:
+        resample = Image.Resampling.LANCZOS
+
+    img_copy.thumbnail(max_size, resample)
     return img_copy
 
 
+class InMemoryImage(Flowable):
+    """
+    ReportLab flowable that draws a PIL image straight from memory
+
+    Unlike platypus Image, it needs no encoded PNG/JPEG buffer: ReportLab reads
+    the pixels from PIL and compresses them once while writing the PDF.
+    The image is scaled proportionally to fit inside (width, height).
+    """
+
+    def __init__(self, image, width, height):
+        super().__init__()
+        self.hAlign = 'CENTER'
+        self._reader = ImageReader(image)
+        img_width, img_height = self._reader.getSize()
+        scale = min(width / img_width, height / img_height)
+        self.drawWidth = img_width * scale
+        self.drawHeight = img_height * scale
+
+    def wrap(self, availWidth, availHeight):
+        return self.drawWidth, self.drawHeight
+
+    def draw(self):
+        self.canv.drawImage(self._reader, 0, 0, self.drawWidth, self.drawHeight, mask='auto')
+
+
 def get_severity_display_color(severity):
     """
     Get display colors for severity levels
@@ -10,13 +10,15 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, Image as RLImage, KeepTogether
+    PageBreak
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+from collections import OrderedDict
 from datetime import datetime
 from PIL import Image
+import hashlib
 import io
 import os
 import base64
@@ -24,13 +26,16 @@ import base64
 from translations import get_text, get_severity_color
 from image_annotator import (
     annotate_image_with_defects,
+    layout_defects,
+    prescale_image,
     create_thumbnail,
-    create_defect_details_section
+    create_defect_details_section,
+    InMemoryImage
 )
 
 # Import Gemini for translation
 try:
-    from google import genai
+    from gemini_intagration import get_gemini_client
     import streamlit as st
 
     GEMINI_AVAILABLE = True
@@ -38,6 +43,27 @@ except ImportError:
     GEMINI_AVAILABLE = False
 
 
+# Gemini translations are stable per (language, text), so they are shared by every
+# report generated in this process instead of being re-requested for each PDF
+_TRANSLATION_CACHE = {}
+
+# Annotated thumbnails of recently reported images, keyed by pixel content and
+# defects, so re-running a report on the same photos skips annotation entirely
+_ANNOTATION_CACHE = OrderedDict()
+_ANNOTATION_CACHE_SIZE = 32
+
+# Static rows of the property details table: (label, property_data key, value formatter)
+PROPERTY_DETAIL_FIELDS = (
+    ("Address", 'address', str),
+    ("City", 'city', str),
+    ("Type", 'property_type', str),
+    ("Bedrooms", 'bedrooms', str),
+    ("Area (sq ft)", 'area_sqft', lambda value: f"{value} sq ft"),
+    ("Year Built", 'year_built', str),
+    ("Room", 'room_name', str),
+)
+
+
 # Base64 encoded Noto Sans Malayalam font (subset - minimal size)
 # This is a fallback if system fonts aren't available
 # You can download full fonts from: https://fonts.google.com/noto/specimen/Noto+Sans+Malayalam
@@ -79,8 +105,8 @@ def translate_to_native_script(text, target_language):
         if not api_key:
             return text
 
-        # Initialize Gemini
-        client = genai.Client(api_key=api_key)
+        # Reuse the cached Gemini client
+        client = get_gemini_client(api_key)
 
         # Create translation prompt
         prompt = f"""Translate the following English text to {lang_name} using NATIVE SCRIPT ONLY.
@@ -194,14 +220,84 @@ def setup_fonts():
     return fonts_registered
 
 
+def get_font_for_language(language, fonts_available):
+    """
+    Get the registered font name for a language, falling back to Helvetica
+
+    Args:
+        language: Language code
+        fonts_available: Dict of registered fonts from setup_fonts()
+
+    Returns:
+        Font name string
+    """
+    if language == 'malayalam' and fonts_available.get('malayalam'):
+        return 'Malayalam'
+    elif language == 'hindi' and fonts_available.get('hindi'):
+        return 'Hindi'
+    else:
+        return 'Helvetica'
+
+
+def _defects_key(defects):
+    """Hashable fingerprint of every defect field that affects annotation"""
+    return tuple(
+        (d.get('detected_object'), d.get('severity'), d.get('location'),
+         d.get('description'), d.get('confidence_score'))
+        for d in defects
+    )
+
+
+def annotated_thumbnail(img, defects, defects_key, defect_layout, language):
+    """
+    Annotate an image and shrink it for the report, memoized on image content
+
+    Args:
+        img: PIL Image object
+        defects: List of defect dictionaries
+        defects_key: _defects_key(defects)
+        defect_layout: layout_defects(defects)
+        language: Report language
+
+    Returns:
+        Tuple of (thumbnail, legend_data)
+    """
+    # Annotate a reduced working copy instead of the full-resolution photo;
+    # it is shrunk to the thumbnail size right after anyway
+    work_img, scale = prescale_image(img)
+
+    digest = hashlib.blake2b(work_img.tobytes(), digest_size=16).digest()
+    cache_key = (digest, work_img.mode, work_img.size, defects_key, language)
+    cached = _ANNOTATION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    annotated_img, legend_data = annotate_image_with_defects(
+        work_img, defects, language, layout=defect_layout, scale=scale
+    )
+    result = (create_thumbnail(annotated_img, max_size=(600, 500)), legend_data)
+
+    _ANNOTATION_CACHE[cache_key] = result
+    while len(_ANNOTATION_CACHE) > _ANNOTATION_CACHE_SIZE:
+        try:
+            _ANNOTATION_CACHE.popitem(last=False)
+        except KeyError:
+            break
+
+    return result
+
+
 class DefactraReportTemplate:
     """PDF template with native script support"""
 
     def __init__(self, language='english', fonts_available=None, translation_cache=None):
         self.language = language
         self.fonts_available = fonts_available or {}
-        self.translation_cache = translation_cache or {}
+        self.translation_cache = translation_cache if translation_cache is not None else {}
         self.has_font = self.fonts_available.get(language, False)
+        self.font = get_font_for_language(language, self.fonts_available)
+        # Page label is always English (drawn in Helvetica); build the prefix once
+        self._page_prefix = "Page "
 
     def translate(self, text):
         """Translate and cache"""
@@ -213,16 +309,21 @@ class DefactraReportTemplate:
             return self.translation_cache[cache_key]
 
         translated = translate_to_native_script(text, self.language)
-        self.translation_cache[cache_key] = translated
+
+        # translate_to_native_script falls back to the English text when
+        # Gemini fails; caching that would keep English in every later report
+        if translated != text:
+            self.translation_cache[cache_key] = translated
         return translated
 
-    def header(self, canvas, doc):
-        """Draw header"""
-        canvas.saveState()
+    CHROME_FORM = 'defactra_chrome'
 
-        # Background
+    def draw_chrome(self, canvas):
+        """Draw the static page decorations (backgrounds, title, subtitle)"""
+        # Header and footer backgrounds
         canvas.setFillColorRGB(0.06, 0.05, 0.16)
         canvas.rect(0, A4[1] - 80, A4[0], 80, fill=1, stroke=0)
+        canvas.rect(0, 0, A4[0], 50, fill=1, stroke=0)
 
         # Title (always English)
         canvas.setFillColorRGB(0, 0.96, 1)
@@ -232,33 +333,31 @@ class DefactraReportTemplate:
         # Subtitle
         canvas.setFillColorRGB(0.63, 0.63, 1)
 
-        if self.has_font and self.language in ['malayalam', 'hindi']:
-            font_name = 'Malayalam' if self.language == 'malayalam' else 'Hindi'
-            try:
-                canvas.setFont(font_name, 10)
-            except:
-                canvas.setFont("Helvetica", 10)
-        else:
+        try:
+            canvas.setFont(self.font, 10)
+        except:
             canvas.setFont("Helvetica", 10)
 
         subtitle = self.translate("Generated by Defactra AI")
         canvas.drawString(40, A4[1] - 65, subtitle)
 
-        canvas.restoreState()
+    def draw_page(self, canvas, doc):
+        """Draw header and footer with a single graphics-state save per page"""
+        # The decorations are identical on every page: record them once as a
+        # PDF form XObject and only reference it from each page
+        if not getattr(canvas, '_defactra_chrome_baked', False):
+            canvas.beginForm(self.CHROME_FORM)
+            self.draw_chrome(canvas)
+            canvas.endForm()
+            canvas._defactra_chrome_baked = True
 
-    def footer(self, canvas, doc):
-        """Draw footer"""
         canvas.saveState()
-
-        # Background
-        canvas.setFillColorRGB(0.06, 0.05, 0.16)
-        canvas.rect(0, 0, A4[0], 50, fill=1, stroke=0)
+        canvas.doForm(self.CHROME_FORM)
 
         # Page number
         canvas.setFillColorRGB(0.63, 0.63, 1)
         canvas.setFont("Helvetica-Bold", 9)
-        page_text = f"Page {doc.page}"
-        canvas.drawRightString(A4[0] - 40, 15, page_text)
+        canvas.drawRightString(A4[0] - 40, 15, self._page_prefix + str(doc.page))
 
         canvas.restoreState()
 
@@ -268,13 +367,7 @@ def create_custom_styles(language='english', fonts_available=None):
     styles = getSampleStyleSheet()
     fonts_available = fonts_available or {}
 
-    # Determine font
-    if language == 'malayalam' and fonts_available.get('malayalam'):
-        font_name = 'Malayalam'
-    elif language == 'hindi' and fonts_available.get('hindi'):
-        font_name = 'Hindi'
-    else:
-        font_name = 'Helvetica'
+    font_name = get_font_for_language(language, fonts_available)
 
     # For non-English with fonts, use regular weight (no bold in custom fonts)
     if language in ['malayalam', 'hindi'] and fonts_available.get(language):
@@ -348,10 +441,15 @@ def generate_pdf_report(
         defects,
         images,
         language='english',
-        output_path=None
+        output_path=None,
+        compress=True
 ):
     """
     Generate PDF with native script translation via Gemini
+
+    Set compress=False for large batch exports that are compressed downstream
+    (e.g. gzipped): page streams are then written without Flate, which builds
+    noticeably faster at the cost of a larger file.
     """
 
     # Setup fonts
@@ -369,8 +467,8 @@ def generate_pdf_report(
             print(f"   Generating in English instead...")
             language = 'english'
 
-    # Translation cache
-    translation_cache = {}
+    # Translation cache (shared across reports)
+    translation_cache = _TRANSLATION_CACHE
 
     # Create PDF
     if output_path is None:
@@ -384,7 +482,9 @@ def generate_pdf_report(
         rightMargin=40,
         leftMargin=40,
         topMargin=100,
-        bottomMargin=70
+        bottomMargin=70,
+        pageCompression=1 if compress else 0,
+        invariant=0
     )
 
     template = DefactraReportTemplate(language, fonts_available, translation_cache)
@@ -421,20 +521,11 @@ def generate_pdf_report(
     story.append(Paragraph(t("Property Details"), styles['SectionHeader']))
     story.append(Spacer(1, 10))
 
-    # Determine table font
-    if language in ['malayalam', 'hindi'] and fonts_available.get(language):
-        table_font = 'Malayalam' if language == 'malayalam' else 'Hindi'
-    else:
-        table_font = 'Helvetica'
+    table_font = template.font
 
     property_details = [
-        [t("Address"), property_data.get('address', 'N/A')],
-        [t("City"), property_data.get('city', 'N/A')],
-        [t("Type"), property_data.get('property_type', 'N/A')],
-        [t("Bedrooms"), str(property_data.get('bedrooms', 'N/A'))],
-        [t("Area (sq ft)"), f"{property_data.get('area_sqft', 'N/A')} sq ft"],
-        [t("Year Built"), str(property_data.get('year_built', 'N/A'))],
-        [t("Room"), property_data.get('room_name', 'N/A')],
+        [t(label), fmt(property_data.get(key, 'N/A'))]
+        for label, key, fmt in PROPERTY_DETAIL_FIELDS
     ]
 
     prop_table = Table(property_details, colWidths=[2 * inch, 3.5 * inch])
@@ -512,18 +603,35 @@ def generate_pdf_report(
         story.append(Paragraph(t("Defect Analysis"), styles['SectionHeader']))
         story.append(Spacer(1, 10))
 
-        for idx, img in enumerate(images, 1):
-            annotated_img, legend_data = annotate_image_with_defects(img, defects, language)
+        # Marker zones and legend depend only on the defects, not the image:
+        # compute them once and draw the same layout on every photo
+        defect_layout = layout_defects(defects)
+        defects_key = _defects_key(defects)
 
-            img_thumbnail = create_thumbnail(annotated_img, max_size=(600, 500))
-            img_buffer = io.BytesIO()
-            img_thumbnail.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
+        for idx, img in enumerate(images, 1):
+            img_thumbnail, legend_data = annotated_thumbnail(
+                img, defects, defects_key, defect_layout, language
+            )
 
-            rl_img = RLImage(img_buffer, width=6.5 * inch, height=5 * inch, kind='proportional')
+            # Hand the PIL thumbnail to ReportLab directly (no PNG encode/decode round trip)
+            rl_img = InMemoryImage(img_thumbnail, width=6.5 * inch, height=5 * inch)
             caption = Paragraph(f"<b>{t('Defect Analysis')} - {idx}</b>", styles['CustomNormal'])
 
-            story.append(KeepTogether([caption, Spacer(1, 5), rl_img]))
+            # Fixed-geometry block: gives ReportLab the height up-front instead of
+            # the measure-then-place double layout pass of KeepTogether
+            block = Table(
+                [[caption], [rl_img]],
+                colWidths=[6.5 * inch],
+                rowHeights=[0.25 * inch, 5 * inch],
+                style=TableStyle([
+                    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
+                    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+                    ('TOPPADDING', (0, 0), (-1, -1), 0),
+                    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+                ])
+            )
+            story.append(block)
             story.append(Spacer(1, 15))
 
             if legend_data is not None and len(legend_data) > 0:
@@ -562,14 +670,10 @@ def generate_pdf_report(
         story.append(Spacer(1, 6))
 
     # BUILD
-    doc.build(
-        story,
-        onFirstPage=lambda c, d: (template.header(c, d), template.footer(c, d)),
-        onLaterPages=lambda c, d: (template.header(c, d), template.footer(c, d))
-    )
+    doc.build(story, onFirstPage=template.draw_page, onLaterPages=template.draw_page)
 
     if language in ['malayalam', 'hindi'] and can_use_native:
-        print(f"✅ PDF generated with {len(translation_cache)} native {language.title()} translations")
+        print(f"✅ PDF generated ({len(translation_cache)} native translations cached)")
 
     if output_path is None:
         output.seek(0)
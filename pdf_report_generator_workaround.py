@@ -10,21 +10,56 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, Image as RLImage, KeepTogether
+    PageBreak, KeepTogether
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
 from PIL import Image
 import io
-import os
+import re
+import sys
 
 from translations import get_text, get_severity_color
+from fonts_util import register_unicode_fonts
 from image_annotator import (
     annotate_image_with_defects,
     create_thumbnail,
-    create_defect_details_section
+    create_defect_details_section,
+    InMemoryImage
+)
+
+# Brand and severity colours, parsed once at import
+_CYAN = colors.HexColor('#00F5FF')
+_BLUE = colors.HexColor('#0080FF')
+_TEXT_DARK = colors.HexColor('#303030')
+_TEXT_GREY = colors.HexColor('#404040')
+_PROP_BG = colors.HexColor('#E8F4FF')
+_SUMMARY_BG = colors.HexColor('#F0F8FF')
+_GRID = colors.HexColor('#CCCCCC')
+_RED = colors.HexColor('#FF0066')
+_ORANGE = colors.HexColor('#FF6600')
+_YELLOW = colors.HexColor('#FFCC00')
+_GREEN = colors.HexColor('#00FF99')
+
+# (translation key, property_data key, formatter) for each property details row
+PROPERTY_DETAIL_FIELDS = (
+    ('address', 'address', str),
+    ('city', 'city', str),
+    ('property_type', 'property_type', str),
+    ('bedrooms', 'bedrooms', str),
+    ('area', 'area_sqft', lambda value: f"{value} sq ft"),
+    ('year_built', 'year_built', str),
+    ('room_name', 'room_name', str),
+)
+
+# Translation keys of the executive summary rows, in table order
+SUMMARY_LABEL_KEYS = (
+    'overall_condition', 'usability_rating', 'total_defects',
+    'critical_issues', 'high_priority', 'medium_priority', 'low_priority',
 )
 
 # Romanization mappings for when Unicode fonts are unavailable
@@ -83,99 +118,51 @@ ROMANIZATION = {
     }
 }
 
+# Freeze the tables: read-only views over interned keys
+ROMANIZATION = MappingProxyType({
+    language: MappingProxyType({sys.intern(phrase): roman for phrase, roman in table.items()})
+    for language, table in ROMANIZATION.items()
+})
+
+
+# Unicode block of each script, used to keep matches on whole phrases
+_SCRIPT_RANGES = {
+    'malayalam': '\u0D00-\u0D7F',
+    'hindi': '\u0900-\u097F',
+}
+
+# One compiled alternation per language, longest phrase first so a full phrase
+# wins over any shorter phrase it contains; a match may not be glued to other
+# letters of the same script
+_ROMAN_RE = {
+    language: re.compile(
+        f"(?<![{_SCRIPT_RANGES[language]}])(?:"
+        + '|'.join(re.escape(phrase) for phrase in sorted(table, key=len, reverse=True))
+        + f")(?![{_SCRIPT_RANGES[language]}])"
+    )
+    for language, table in ROMANIZATION.items()
+}
+
 
 def romanize_text(text, language):
     """
     Romanize Malayalam/Hindi text when Unicode fonts are unavailable
 
+    Every known phrase in the text is replaced, including phrases embedded
+    in longer strings, in a single regex scan.
+
     Args:
         text: Text to romanize
         language: Language code
 
     Returns:
-        Romanized text or original if not found
+        Text with known phrases romanized, or the original text
     """
-    if language not in ['malayalam', 'hindi']:
+    if language not in _ROMAN_RE:
         return text
 
-    if language in ROMANIZATION and text in ROMANIZATION[language]:
-        romanized = ROMANIZATION[language][text]
-        return f"{romanized} [{text}]"  # Show both versions
-
-    return text
-
-
-def try_register_unicode_fonts():
-    """
-    Try to register Unicode fonts if available
-    Returns dict of successfully registered fonts
-    """
-    fonts_registered = {}
-
-    try:
-        # Common font locations
-        font_paths = [
-            '/usr/share/fonts/truetype/noto/',
-            '/usr/share/fonts/truetype/liberation/',
-            '/usr/share/fonts/truetype/dejavu/',
-            '/usr/share/fonts/truetype/freefont/',
-            '/usr/local/share/fonts/',
-        ]
-
-        # Malayalam fonts to try
-        malayalam_fonts = [
-            'NotoSansMalayalam-Regular.ttf',
-            'NotoSansMalayalam.ttf',
-            'Meera-Regular.ttf',
-            'FreeSerif.ttf',  # Has some Unicode support
-        ]
-
-        # Hindi fonts to try
-        hindi_fonts = [
-            'NotoSansDevanagari-Regular.ttf',
-            'NotoSansDevanagari.ttf',
-            'Lohit-Devanagari.ttf',
-            'FreeSerif.ttf',  # Has some Unicode support
-        ]
-
-        # Try to register Malayalam font
-        for font_dir in font_paths:
-            if not os.path.exists(font_dir):
-                continue
-            for font_file in malayalam_fonts:
-                full_path = os.path.join(font_dir, font_file)
-                if os.path.exists(full_path):
-                    try:
-                        pdfmetrics.registerFont(TTFont('Malayalam', full_path))
-                        fonts_registered['malayalam'] = True
-                        print(f"✅ Malayalam font registered: {font_file}")
-                        break
-                    except:
-                        continue
-            if 'malayalam' in fonts_registered:
-                break
-
-        # Try to register Hindi font
-        for font_dir in font_paths:
-            if not os.path.exists(font_dir):
-                continue
-            for font_file in hindi_fonts:
-                full_path = os.path.join(font_dir, font_file)
-                if os.path.exists(full_path):
-                    try:
-                        pdfmetrics.registerFont(TTFont('Hindi', full_path))
-                        fonts_registered['hindi'] = True
-                        print(f"✅ Hindi font registered: {font_file}")
-                        break
-                    except:
-                        continue
-            if 'hindi' in fonts_registered:
-                break
-
-    except Exception as e:
-        print(f"⚠️ Font registration warning: {e}")
-
-    return fonts_registered
+    table = ROMANIZATION[language]
+    return _ROMAN_RE[language].sub(lambda m: f"{table[m.group(0)]} [{m.group(0)}]", text)
 
 
 def get_font_for_language(language, fonts_available):
@@ -206,13 +193,18 @@ class DefactraReportTemplate:
         self.font = get_font_for_language(language, self.fonts_available)
         self.use_romanization = language in ['malayalam', 'hindi'] and not self.fonts_available.get(language)
 
-    def header(self, canvas, doc):
-        """Draw header on each page"""
+        self.subtitle_text = get_text('generated_by', language)
+        if self.use_romanization:
+            self.subtitle_text = romanize_text(self.subtitle_text, language)
+
+    def draw_page(self, canvas, doc):
+        """Draw header and footer with a single graphics-state save per page"""
         canvas.saveState()
 
-        # Header background
+        # Header and footer backgrounds
         canvas.setFillColorRGB(0.06, 0.05, 0.16)
         canvas.rect(0, A4[1] - 80, A4[0], 80, fill=1, stroke=0)
+        canvas.rect(0, 0, A4[0], 50, fill=1, stroke=0)
 
         # Defactra logo/title
         canvas.setFillColorRGB(0, 0.96, 1)
@@ -225,35 +217,31 @@ class DefactraReportTemplate:
             canvas.setFont(self.font, 10)
         except:
             canvas.setFont("Helvetica", 10)
+        canvas.drawString(40, A4[1] - 65, self.subtitle_text)
 
-        subtitle_text = get_text('generated_by', self.language)
-        if self.use_romanization:
-            subtitle_text = romanize_text(subtitle_text, self.language)
-        canvas.drawString(40, A4[1] - 65, subtitle_text)
+        # Page number - always use English, same fill colour as the subtitle
+        canvas.setFont("Helvetica-Bold", 9)
+        canvas.drawRightString(A4[0] - 40, 15, f"Page {doc.page}")
 
         canvas.restoreState()
 
-    def footer(self, canvas, doc):
-        """Draw footer on each page"""
-        canvas.saveState()
-
-        # Footer background
-        canvas.setFillColorRGB(0.06, 0.05, 0.16)
-        canvas.rect(0, 0, A4[0], 50, fill=1, stroke=0)
 
-        # Page number - always use English
-        canvas.setFillColorRGB(0.63, 0.63, 1)
-        canvas.setFont("Helvetica-Bold", 9)
-        page_text = f"Page {doc.page}"
-        canvas.drawRightString(A4[0] - 40, 15, page_text)
+def create_custom_styles(language='english', fonts_available=None):
+    """
+    Create custom paragraph styles
 
-        canvas.restoreState()
+    The finished stylesheet is cached per language and font availability, so
+    it is shared between reports and must not be modified by callers.
+    """
+    fonts_key = tuple(sorted((fonts_available or {}).items()))
+    return _styles_for(language, fonts_key)
 
 
-def create_custom_styles(language='english', fonts_available=None):
-    """Create custom paragraph styles"""
+@lru_cache(maxsize=8)
+def _styles_for(language, fonts_key):
+    """Build the stylesheet for create_custom_styles"""
     styles = getSampleStyleSheet()
-    fonts_available = fonts_available or {}
+    fonts_available = dict(fonts_key)
 
     base_font = get_font_for_language(language, fonts_available)
 
@@ -271,7 +259,7 @@ def create_custom_styles(language='english', fonts_available=None):
         name='CustomTitle',
         parent=styles['Heading1'],
         fontSize=24,  # Slightly smaller to fit romanized text
-        textColor=colors.HexColor('#00F5FF'),
+        textColor=_CYAN,
         spaceAfter=20,
         alignment=TA_CENTER,
         fontName=title_font,
@@ -282,7 +270,7 @@ def create_custom_styles(language='english', fonts_available=None):
         name='SectionHeader',
         parent=styles['Heading2'],
         fontSize=16,
-        textColor=colors.HexColor('#00F5FF'),
+        textColor=_CYAN,
         spaceAfter=12,
         spaceBefore=20,
         fontName=header_font,
@@ -293,7 +281,7 @@ def create_custom_styles(language='english', fonts_available=None):
         name='SubsectionHeader',
         parent=styles['Heading3'],
         fontSize=12,
-        textColor=colors.HexColor('#0080FF'),
+        textColor=_BLUE,
         spaceAfter=8,
         spaceBefore=12,
         fontName=header_font,
@@ -304,7 +292,7 @@ def create_custom_styles(language='english', fonts_available=None):
         name='CustomNormal',
         parent=styles['Normal'],
         fontSize=9,
-        textColor=colors.HexColor('#303030'),
+        textColor=_TEXT_DARK,
         spaceAfter=6,
         alignment=TA_JUSTIFY,
         fontName=normal_font,
@@ -315,7 +303,7 @@ def create_custom_styles(language='english', fonts_available=None):
         name='DefectDescription',
         parent=styles['Normal'],
         fontSize=8,
-        textColor=colors.HexColor('#404040'),
+        textColor=_TEXT_GREY,
         spaceAfter=4,
         leftIndent=10,
         alignment=TA_LEFT,
@@ -327,7 +315,7 @@ def create_custom_styles(language='english', fonts_available=None):
         name='DefectDesc',
         parent=styles['Normal'],
         fontSize=8,
-        textColor=colors.HexColor('#404040'),
+        textColor=_TEXT_GREY,
         spaceAfter=4,
         leftIndent=20,
         fontName=normal_font,
@@ -348,8 +336,8 @@ def generate_pdf_report(
     Generate PDF report with Unicode support and romanization fallback
     """
 
-    # Try to register Unicode fonts
-    fonts_available = try_register_unicode_fonts()
+    # Try to register Unicode fonts; English only needs the built-in Helvetica
+    fonts_available = register_unicode_fonts() if language in ['malayalam', 'hindi'] else {}
 
     use_romanization = language in ['malayalam', 'hindi'] and not fonts_available.get(language)
 
@@ -376,7 +364,9 @@ def generate_pdf_report(
     story = []
     styles = create_custom_styles(language, fonts_available)
 
-    # Helper function to get text
+    # Helper function to get text; language and romanization are fixed for
+    # this report, so each key is resolved once
+    @lru_cache(maxsize=None)
     def get_localized_text(key):
         text = get_text(key, language)
         if use_romanization:
@@ -407,22 +397,17 @@ def generate_pdf_report(
     table_font = get_font_for_language(language, fonts_available)
 
     property_details = [
-        [get_localized_text('address'), property_data.get('address', 'N/A')],
-        [get_localized_text('city'), property_data.get('city', 'N/A')],
-        [get_localized_text('property_type'), property_data.get('property_type', 'N/A')],
-        [get_localized_text('bedrooms'), str(property_data.get('bedrooms', 'N/A'))],
-        [get_localized_text('area'), f"{property_data.get('area_sqft', 'N/A')} sq ft"],
-        [get_localized_text('year_built'), str(property_data.get('year_built', 'N/A'))],
-        [get_localized_text('room_name'), property_data.get('room_name', 'N/A')],
+        (get_localized_text(label_key), fmt(property_data.get(key, 'N/A')))
+        for label_key, key, fmt in PROPERTY_DETAIL_FIELDS
     ]
 
     prop_table = Table(property_details, colWidths=[2.5 * inch, 3 * inch])
     prop_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#E8F4FF')),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#0080FF')),
+        ('BACKGROUND', (0, 0), (0, -1), _PROP_BG),
+        ('TEXTCOLOR', (0, 0), (0, -1), _BLUE),
         ('FONTNAME', (0, 0), (-1, -1), table_font),
         ('FONTSIZE', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
+        ('GRID', (0, 0), (-1, -1), 0.5, _GRID),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('PADDING', (0, 0), (-1, -1), 6),
     ]))
@@ -434,47 +419,46 @@ def generate_pdf_report(
     story.append(Spacer(1, 10))
 
     total_defects = len(defects)
-    critical_count = len([d for d in defects if d.get('severity', '').lower() == 'critical'])
-    high_count = len([d for d in defects if d.get('severity', '').lower() == 'high'])
-    medium_count = len([d for d in defects if d.get('severity', '').lower() == 'medium'])
-    low_count = len([d for d in defects if d.get('severity', '').lower() == 'low'])
+    severity_counts = Counter((d.get('severity') or '').lower() for d in defects)
+    critical_count = severity_counts['critical']
+    high_count = severity_counts['high']
+    medium_count = severity_counts['medium']
+    low_count = severity_counts['low']
 
     overall_score = property_data.get('overall_score', 75)
     usability = property_data.get('usability', 'good')
 
-    summary_data = [
-        [get_localized_text('overall_condition'), f"{overall_score}/100"],
-        [get_localized_text('usability_rating'), usability.upper()],
-        [get_localized_text('total_defects'), str(total_defects)],
-        [get_localized_text('critical_issues'), str(critical_count)],
-        [get_localized_text('high_priority'), str(high_count)],
-        [get_localized_text('medium_priority'), str(medium_count)],
-        [get_localized_text('low_priority'), str(low_count)],
-    ]
+    summary_values = (
+        f"{overall_score}/100", usability.upper(), str(total_defects),
+        str(critical_count), str(high_count), str(medium_count), str(low_count),
+    )
+    summary_data = list(zip(map(get_localized_text, SUMMARY_LABEL_KEYS), summary_values))
 
-    summary_table = Table(summary_data, colWidths=[3 * inch, 2 * inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F8FF')),
-        ('BACKGROUND', (1, 0), (1, 0), colors.HexColor('#00F5FF')),
+    summary_style = [
+        ('BACKGROUND', (0, 0), (0, -1), _SUMMARY_BG),
+        ('BACKGROUND', (1, 0), (1, 0), _CYAN),
         ('TEXTCOLOR', (1, 0), (1, 0), colors.white),
         ('FONTNAME', (0, 0), (-1, -1), table_font),
         ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
+        ('GRID', (0, 0), (-1, -1), 1, _GRID),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
         ('PADDING', (0, 0), (-1, -1), 8),
-    ]))
+    ]
 
     # Color coding
     if critical_count > 0:
-        summary_table.setStyle(TableStyle(
-            [('BACKGROUND', (1, 3), (1, 3), colors.HexColor('#FF0066')), ('TEXTCOLOR', (1, 3), (1, 3), colors.white)]))
+        summary_style.extend([('BACKGROUND', (1, 3), (1, 3), _RED),
+                              ('TEXTCOLOR', (1, 3), (1, 3), colors.white)])
     if high_count > 0:
-        summary_table.setStyle(TableStyle(
-            [('BACKGROUND', (1, 4), (1, 4), colors.HexColor('#FF6600')), ('TEXTCOLOR', (1, 4), (1, 4), colors.white)]))
+        summary_style.extend([('BACKGROUND', (1, 4), (1, 4), _ORANGE),
+                              ('TEXTCOLOR', (1, 4), (1, 4), colors.white)])
     if medium_count > 0:
-        summary_table.setStyle(TableStyle([('BACKGROUND', (1, 5), (1, 5), colors.HexColor('#FFCC00'))]))
+        summary_style.append(('BACKGROUND', (1, 5), (1, 5), _YELLOW))
     if low_count > 0:
-        summary_table.setStyle(TableStyle([('BACKGROUND', (1, 6), (1, 6), colors.HexColor('#00FF99'))]))
+        summary_style.append(('BACKGROUND', (1, 6), (1, 6), _GREEN))
+
+    summary_table = Table(summary_data, colWidths=[3 * inch, 2 * inch])
+    summary_table.setStyle(TableStyle(summary_style))
 
     story.append(summary_table)
     story.append(Spacer(1, 20))
@@ -482,20 +466,24 @@ def generate_pdf_report(
     # ANNOTATED IMAGES
     if images:
         story.append(PageBreak())
-        story.append(Paragraph(get_localized_text('defect_analysis'), styles['SectionHeader']))
+        defect_analysis_text = get_localized_text('defect_analysis')
+        story.append(Paragraph(defect_analysis_text, styles['SectionHeader']))
         story.append(Spacer(1, 10))
 
-        for idx, img in enumerate(images, 1):
+        def prepare_image(img):
             annotated_img, legend_data = annotate_image_with_defects(img, defects, language)
+            return create_thumbnail(annotated_img, max_size=(600, 500)), legend_data
 
-            img_thumbnail = create_thumbnail(annotated_img, max_size=(600, 500))
-            img_buffer = io.BytesIO()
-            img_thumbnail.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
+        # PIL releases the GIL while decoding, drawing and resizing, so the
+        # images are annotated concurrently; results keep their input order
+        with ThreadPoolExecutor(max_workers=min(8, len(images))) as executor:
+            prepared = list(executor.map(prepare_image, images))
 
-            rl_img = RLImage(img_buffer, width=6 * inch, height=4.5 * inch, kind='proportional')
+        for idx, (img_thumbnail, legend_data) in enumerate(prepared, 1):
+            # Drawn straight from the PIL pixels, no intermediate PNG buffer
+            rl_img = InMemoryImage(img_thumbnail, width=6 * inch, height=4.5 * inch)
 
-            caption = Paragraph(f"<b>{get_localized_text('defect_analysis')} - {idx}</b>", styles['CustomNormal'])
+            caption = Paragraph(f"<b>{defect_analysis_text} - {idx}</b>", styles['CustomNormal'])
 
             story.append(KeepTogether([caption, Spacer(1, 5), rl_img]))
             story.append(Spacer(1, 15))
@@ -531,8 +519,8 @@ def generate_pdf_report(
     # BUILD PDF
     doc.build(
         story,
-        onFirstPage=lambda c, d: (template.header(c, d), template.footer(c, d)),
-        onLaterPages=lambda c, d: (template.header(c, d), template.footer(c, d))
+        onFirstPage=template.draw_page,
+        onLaterPages=template.draw_page
     )
 
     if output_path is None:
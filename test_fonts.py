@@ -6,9 +6,8 @@ Tests if the fonts are properly installed and working
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib import colors
+from fonts_util import register_unicode_fonts
 import io
 import os
 
@@ -25,69 +24,10 @@ test_texts = {
 }
 
 
-def find_and_register_fonts():
-    """Find and register Unicode fonts"""
-    font_paths = [
-        '/usr/share/fonts/truetype/noto/',
-        '/usr/share/fonts/truetype/liberation/',
-        '/usr/share/fonts/truetype/dejavu/',
-    ]
-
-    fonts_found = {}
-
-    # Try Malayalam fonts
-    malayalam_fonts = [
-        'NotoSansMalayalam-Regular.ttf',
-        'NotoSansMalayalam.ttf',
-        'Meera-Regular.ttf',
-    ]
-
-    for font_dir in font_paths:
-        if not os.path.exists(font_dir):
-            continue
-        for font_file in malayalam_fonts:
-            full_path = os.path.join(font_dir, font_file)
-            if os.path.exists(full_path):
-                try:
-                    pdfmetrics.registerFont(TTFont('Malayalam', full_path))
-                    fonts_found['malayalam'] = full_path
-                    print(f"✅ Malayalam font registered: {font_file}")
-                    break
-                except Exception as e:
-                    print(f"⚠️  Failed to register {font_file}: {e}")
-        if 'malayalam' in fonts_found:
-            break
-
-    # Try Hindi fonts
-    hindi_fonts = [
-        'NotoSansDevanagari-Regular.ttf',
-        'NotoSansDevanagari.ttf',
-        'Lohit-Devanagari.ttf',
-    ]
-
-    for font_dir in font_paths:
-        if not os.path.exists(font_dir):
-            continue
-        for font_file in hindi_fonts:
-            full_path = os.path.join(font_dir, font_file)
-            if os.path.exists(full_path):
-                try:
-                    pdfmetrics.registerFont(TTFont('Hindi', full_path))
-                    fonts_found['hindi'] = full_path
-                    print(f"✅ Hindi font registered: {font_file}")
-                    break
-                except Exception as e:
-                    print(f"⚠️  Failed to register {font_file}: {e}")
-        if 'hindi' in fonts_found:
-            break
-
-    return fonts_found
-
-
 # Register fonts
 print("1. Searching for Unicode fonts...")
 print()
-fonts_found = find_and_register_fonts()
+fonts_found = register_unicode_fonts()
 print()
 
 if not fonts_found:
@@ -99,6 +39,10 @@ if not fonts_found:
     print()
     exit(1)
 
+# FreeSerif is only a fallback: its Malayalam and Devanagari coverage is partial
+fallback_langs = [lang for lang, font_path in fonts_found.items()
+                  if os.path.basename(font_path) == 'FreeSerif.ttf']
+
 # Create test PDFs
 print("2. Generating test PDFs...")
 print()
@@ -155,10 +99,16 @@ print("=" * 70)
 print()
 print("Results:")
 for lang, font_path in fonts_found.items():
-    print(f"   ✅ {lang.title()}: {os.path.basename(font_path)}")
+    if lang in fallback_langs:
+        print(f"   ⚠️  {lang.title()}: {os.path.basename(font_path)} (fallback, may not shape conjuncts correctly)")
+    else:
+        print(f"   ✅ {lang.title()}: {os.path.basename(font_path)}")
 print()
 
-if len(fonts_found) == 2:
+if fallback_langs:
+    print("⚠️  Using the FreeSerif fallback for: " + ", ".join(lang.title() for lang in fallback_langs))
+    print("   Run install_fonts.sh to install the dedicated Noto/Meera/Lohit fonts.")
+elif len(fonts_found) == 2:
     print("🎉 All fonts working! Your PDFs should render correctly.")
     print()
     print("Next steps:")
@@ -6,6 +6,7 @@ Corrected syntax for Gemini 2.5
 from google import genai
 from google.genai import types
 from PIL import Image
+import asyncio
 import io
 
 # Your API key
@@ -23,17 +24,6 @@ try:
     print("   ✅ Client initialized successfully")
     print()
 
-    # Test text generation
-    print("2. Testing text generation...")
-    response = client.models.generate_content(
-        model='gemini-2.5-flash',
-        contents="Say 'Hello! I am working!' if you can read this."
-    )
-    print(f"   ✅ Response: {response.text}")
-    print()
-
-    # Test with image - CORRECTED SYNTAX
-    print("3. Testing image analysis...")
     # Create a simple test image (red square)
     test_img = Image.new('RGB', (100, 100), color='red')
 
@@ -42,18 +32,30 @@ try:
     test_img.save(img_byte_arr, format='PNG')
     img_byte_arr = img_byte_arr.getvalue()
 
-    # Test image analysis with corrected syntax
-    response = client.models.generate_content(
-        model='gemini-2.5-flash',
-        contents=[
-            "What is the main color in this image? Answer in one word.",
-            types.Part.from_bytes(
-                data=img_byte_arr,
-                mime_type="image/png"
-            )
-        ]
-    )
-    print(f"   ✅ Image analysis response: {response.text}")
+    # Both tests are network-bound, so send them concurrently through the
+    # async client instead of waiting for one round trip before the other
+    async def run_tests():
+        return await asyncio.gather(
+            client.aio.models.generate_content(
+                model='gemini-2.5-flash',
+                contents="Say 'Hello! I am working!' if you can read this."
+            ),
+            client.aio.models.generate_content(
+                model='gemini-2.5-flash',
+                contents=[
+                    "What is the main color in this image? Answer in one word.",
+                    types.Part.from_bytes(
+                        data=img_byte_arr,
+                        mime_type="image/png"
+                    )
+                ]
+            ),
+        )
+
+    print("2. Testing text generation and image analysis...")
+    text_response, image_response = asyncio.run(run_tests())
+    print(f"   ✅ Response: {text_response.text}")
+    print(f"   ✅ Image analysis response: {image_response.text}")
     print()
 
     print("=" * 70)
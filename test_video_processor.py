@@ -0,0 +1,118 @@
+"""
+Tests for video_processor: run with `python -m pytest test_video_processor.py`
+"""
+
+import json
+import threading
+
+import cv2
+import numpy as np
+import pytest
+
+from video_processor import VideoProcessor
+
+
+@pytest.fixture
+def video_path(tmp_path):
+    """Write a 300-frame 30 fps test video whose brightness encodes the frame number"""
+    path = str(tmp_path / "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 30.0, (64, 48))
+    for frame_number in range(300):
+        writer.write(np.full((48, 64, 3), frame_number % 256, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def test_batches_are_analyzed_concurrently(video_path):
+    # 10 frames (one per second) in batches of 3 -> sizes [3, 3, 3, 1]
+    processor = VideoProcessor(frame_interval=30, max_frames=10)
+
+    # Each of the first two batches waits for the other, so this only
+    # passes if two batch_analyzer calls are in flight at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    batch_sizes = []
+    lock = threading.Lock()
+
+    def batch_analyzer(images):
+        with lock:
+            batch_sizes.append(len(images))
+            call = len(batch_sizes)
+        if call <= 2:
+            barrier.wait()
+        return [{'detections': [{'detected_object': 'crack', 'severity': 'low'}],
+                 'overall_condition_score': 70} for _ in images]
+
+    results = processor.analyze_video_with_ai(
+        video_path, None, batch_analyzer=batch_analyzer, batch_size=3, max_workers=4)
+
+    assert sorted(batch_sizes) == [1, 3, 3, 3]
+    assert results['frames_analyzed'] == 10
+    assert [f['frame_number'] for f in results['frame_analyses']] == list(range(0, 300, 30))
+
+
+def test_batch_results_keep_frame_order(video_path):
+    processor = VideoProcessor(frame_interval=30, max_frames=10)
+
+    def batch_analyzer(images):
+        # The last, smaller batch finishes first
+        threading.Event().wait(0.05 * len(images))
+        return [
+            {'detections': [{'detected_object': f'defect {len(image)}', 'severity': 'low'}],
+             'overall_condition_score': 70}
+            for image in images
+        ]
+
+    results = processor.analyze_video_with_ai(
+        video_path, None, batch_analyzer=batch_analyzer, batch_size=3, max_workers=4)
+
+    frame_numbers = [d['frame_number'] for d in results['all_detections']]
+    assert frame_numbers == list(range(0, 300, 30))
+
+
+def test_analysis_results_are_json_serializable(video_path):
+    processor = VideoProcessor(frame_interval=30, max_frames=10)
+
+    def ai_analyzer(image):
+        return {'detections': [{'detected_object': 'Crack', 'severity': 'high', 'confidence_score': 80}],
+                'overall_condition_score': 70}
+
+    results = processor.analyze_video_with_ai(video_path, ai_analyzer)
+
+    timeline = json.loads(json.dumps(results['defect_timeline']))
+    occurrences = timeline['crack']['occurrences']
+    assert occurrences['frame_number'] == list(range(0, 300, 30))
+    assert timeline['crack']['avg_confidence'] == 80
+
+
+_VideoCapture = cv2.VideoCapture
+
+
+class _UnknownLengthCapture:
+    """VideoCapture that reports no frame count, as some WebM files do"""
+
+    def __init__(self, *args):
+        self._cap = _VideoCapture(*args)
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return 0
+        return self._cap.get(prop)
+
+    def __getattr__(self, name):
+        return getattr(self._cap, name)
+
+
+def test_unknown_frame_count_reads_until_end_of_stream(video_path, monkeypatch):
+    monkeypatch.setattr(cv2, "VideoCapture", _UnknownLengthCapture)
+    processor = VideoProcessor(frame_interval=30, max_frames=100)
+
+    frames = processor.extract_frames(video_path)
+    assert [frame_number for _, _, frame_number in frames] == list(range(0, 300, 30))
+
+    frames = processor.extract_frames_parallel(video_path, workers=2)
+    assert [frame_number for _, _, frame_number in frames] == list(range(0, 300, 30))
+
+    # max_frames still caps how many frames are read
+    processor = VideoProcessor(frame_interval=30, max_frames=4)
+    frames = list(processor.iter_frames(video_path))
+    assert [frame_number for _, _, frame_number in frames] == [0, 30, 60, 90]
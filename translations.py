@@ -3,6 +3,8 @@ Multi-language Support for Defactra AI Reports
 Languages: English, Malayalam, Hindi
 """
 
+from functools import lru_cache
+
 TRANSLATIONS = {
     'english': {
         # Headers
@@ -213,10 +215,13 @@ TRANSLATIONS = {
 }
 
 
+@lru_cache(maxsize=512)
 def get_text(key, language='english'):
     """
     Get translated text for a given key
 
+    Results are memoized; TRANSLATIONS is treated as read-only after import.
+
     Args:
         key: Translation key
         language: Language code (english, malayalam, hindi)
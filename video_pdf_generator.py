@@ -13,7 +13,9 @@ from reportlab.platypus import (
     PageBreak, Image as RLImage, KeepTogether
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from PIL import Image
 import io
 
@@ -21,6 +23,132 @@ from translations import get_text, get_severity_color
 from image_annotator import annotate_image_with_defects, create_thumbnail
 
 
+# Report colours, parsed once at import
+_CYAN = colors.HexColor('#00F5FF')
+_BLUE = colors.HexColor('#0080FF')
+_TEXT_DARK = colors.HexColor('#303030')
+_TEXT_GREY = colors.HexColor('#404040')
+_PROP_BG = colors.HexColor('#E8F4FF')
+_SUMMARY_BG = colors.HexColor('#F0F8FF')
+_GRID = colors.HexColor('#CCCCCC')
+_GRAY_50 = colors.HexColor('#F9FAFB')
+_GRAY_100 = colors.HexColor('#F3F4F6')
+_GRAY_200 = colors.HexColor('#E5E7EB')
+_GRAY_500 = colors.HexColor('#6B7280')
+_GRAY_800 = colors.HexColor('#1F2937')
+_AMBER_50 = colors.HexColor('#FFFBEB')
+_AMBER_200 = colors.HexColor('#FDE68A')
+_AMBER_900 = colors.HexColor('#78350F')
+_RED = colors.HexColor('#DC2626')
+_ORANGE = colors.HexColor('#F59E0B')
+_YELLOW = colors.HexColor('#FCD34D')
+_GREEN = colors.HexColor('#10B981')
+
+# Table styles are identical for every report, so they are built once at
+# import and shared; Table.setStyle only reads them
+
+# Property details table
+_PROPERTY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _PROP_BG),
+    ('TEXTCOLOR', (0, 0), (0, -1), _BLUE),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 0.5, _GRID),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('PADDING', (0, 0), (-1, -1), 8),
+])
+
+# Video information table
+_VIDEO_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _SUMMARY_BG),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('GRID', (0, 0), (-1, -1), 0.5, _GRID),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('PADDING', (0, 0), (-1, -1), 8),
+])
+
+# Analysis summary table
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (0, -1), _SUMMARY_BG),
+    ('BACKGROUND', (1, 0), (1, 0), _CYAN),
+    ('TEXTCOLOR', (1, 0), (1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('GRID', (0, 0), (-1, -1), 1, _GRID),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('PADDING', (0, 0), (-1, -1), 10),
+])
+
+# Rows per defect card in the frame defects table: header, location,
+# confidence, description, then a spacer row before the next card
+_CARD_ROWS = 5
+_CARD_SPACER_HEIGHT = 10
+
+# Card commands with rows relative to the card's header row. Columns are
+# 1.2in/3.3in/1.5in: the title spans 0-1 beside the severity badge, detail
+# values span 1-2, the description spans all three.
+_CARD_COMMANDS = [
+    # Header row
+    ('SPAN', (0, 0), (1, 0)),
+    ('BACKGROUND', (0, 0), (1, 0), _GRAY_100),
+    ('TEXTCOLOR', (0, 0), (1, 0), _GRAY_800),
+    ('ALIGN', (2, 0), (2, 0), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 6),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 6),
+    ('BOX', (0, 0), (-1, 0), 1, _GRAY_200),
+
+    # Location and confidence rows
+    ('SPAN', (1, 1), (2, 1)),
+    ('SPAN', (1, 2), (2, 2)),
+    ('BACKGROUND', (0, 1), (0, 2), _GRAY_50),
+    ('TEXTCOLOR', (0, 1), (0, 2), _GRAY_500),
+    ('TEXTCOLOR', (1, 1), (-1, 2), _GRAY_800),
+    ('FONTNAME', (0, 1), (0, 2), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 1), (-1, 2), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, 2), 9),
+    ('TOPPADDING', (0, 1), (-1, 2), 4),
+    ('BOTTOMPADDING', (0, 1), (-1, 2), 4),
+    ('GRID', (0, 1), (-1, 2), 0.5, _GRAY_200),
+    ('VALIGN', (0, 1), (-1, 2), 'TOP'),
+
+    # Description row
+    ('SPAN', (0, 3), (-1, 3)),
+    ('BACKGROUND', (0, 3), (-1, 3), _AMBER_50),
+    ('TEXTCOLOR', (0, 3), (-1, 3), _AMBER_900),
+    ('LEFTPADDING', (0, 3), (-1, 3), 10),
+    ('RIGHTPADDING', (0, 3), (-1, 3), 10),
+    ('TOPPADDING', (0, 3), (-1, 3), 8),
+    ('BOTTOMPADDING', (0, 3), (-1, 3), 8),
+    ('BOX', (0, 3), (-1, 3), 1, _AMBER_200),
+    ('VALIGN', (0, 3), (-1, 3), 'TOP'),
+
+    # Spacer row
+    ('SPAN', (0, 4), (-1, 4)),
+    ('TOPPADDING', (0, 4), (-1, 4), 0),
+    ('BOTTOMPADDING', (0, 4), (-1, 4), 0),
+]
+
+# Defect timeline table: a header row, then one row per defect type with
+# its severity cell coloured like the cards
+_TIMELINE_COLUMNS = ["Defect", "Severity", "Detected", "Avg. Confidence", "First Seen", "Last Seen"]
+_TIMELINE_TABLE_STYLE = [
+    ('BACKGROUND', (0, 0), (-1, 0), _GRAY_100),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _GRAY_500),
+    ('TEXTCOLOR', (0, 1), (-1, -1), _GRAY_800),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 1), (1, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (2, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('ALIGN', (1, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('PADDING', (0, 0), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, _GRAY_200),
+]
+
 class DefactraVideoReportTemplate:
     """Custom PDF template for video reports"""
 
@@ -62,81 +190,111 @@ class DefactraVideoReportTemplate:
         canvas.restoreState()
 
 
+@lru_cache(maxsize=4)
 def create_custom_styles(language='english'):
-    """Create custom paragraph styles"""
-    styles = getSampleStyleSheet()
+    """
+    Create custom paragraph styles
+
+    Returns a plain dict of name -> ParagraphStyle, built once per language and
+    shared between reports; callers must not modify it.
+    """
+    base = getSampleStyleSheet()
+    styles = {}
 
-    styles.add(ParagraphStyle(
+    styles['CustomTitle'] = ParagraphStyle(
         name='CustomTitle',
-        parent=styles['Heading1'],
+        parent=base['Heading1'],
         fontSize=28,
-        textColor=colors.HexColor('#00F5FF'),
+        textColor=_CYAN,
         spaceAfter=20,
         alignment=TA_CENTER,
         fontName='Helvetica-Bold'
-    ))
+    )
 
-    styles.add(ParagraphStyle(
+    styles['SectionHeader'] = ParagraphStyle(
         name='SectionHeader',
-        parent=styles['Heading2'],
+        parent=base['Heading2'],
         fontSize=18,
-        textColor=colors.HexColor('#00F5FF'),
+        textColor=_CYAN,
         spaceAfter=12,
         spaceBefore=20,
         fontName='Helvetica-Bold'
-    ))
+    )
 
-    styles.add(ParagraphStyle(
+    styles['SubsectionHeader'] = ParagraphStyle(
         name='SubsectionHeader',
-        parent=styles['Heading3'],
+        parent=base['Heading3'],
         fontSize=14,
-        textColor=colors.HexColor('#0080FF'),
+        textColor=_BLUE,
         spaceAfter=8,
         spaceBefore=12,
         fontName='Helvetica-Bold'
-    ))
+    )
 
-    styles.add(ParagraphStyle(
+    styles['CustomNormal'] = ParagraphStyle(
         name='CustomNormal',
-        parent=styles['Normal'],
+        parent=base['Normal'],
         fontSize=10,
-        textColor=colors.HexColor('#303030'),
+        textColor=_TEXT_DARK,
         spaceAfter=6,
         alignment=TA_JUSTIFY
-    ))
+    )
+
+    # Bold variants set by style rather than <b> markup in the text
+    styles['BoldNormal'] = ParagraphStyle(
+        name='BoldNormal',
+        parent=styles['CustomNormal'],
+        fontName='Helvetica-Bold'
+    )
+
+    styles['SeverityBadge'] = ParagraphStyle(
+        name='SeverityBadge',
+        parent=styles['BoldNormal'],
+        textColor=colors.white
+    )
 
-    styles.add(ParagraphStyle(
+    styles['DefectDescription'] = ParagraphStyle(
         name='DefectDescription',
-        parent=styles['Normal'],
+        parent=base['Normal'],
         fontSize=9,
-        textColor=colors.HexColor('#404040'),
+        textColor=_TEXT_GREY,
         spaceAfter=4,
         leftIndent=10,
         alignment=TA_LEFT
-    ))
+    )
 
     return styles
 
 
+# (background_color, text_color) per lowercase severity
+SEVERITY_DISPLAY_COLORS = {
+    'critical': (_RED, colors.white),  # Red
+    'high': (_ORANGE, colors.white),      # Orange
+    'medium': (_YELLOW, colors.black),    # Yellow
+    'low': (_GREEN, colors.white),       # Green
+}
+DEFAULT_SEVERITY_DISPLAY_COLOR = (_GRAY_500, colors.white)
+
+
 def get_severity_display_color(severity):
     """
     Get display colors for severity levels
 
+    Args:
+        severity: Lowercase severity name; callers normalize it once
+
     Returns tuple of (background_color, text_color)
     """
-    severity_colors = {
-        'critical': (colors.HexColor('#DC2626'), colors.white),  # Red
-        'high': (colors.HexColor('#F59E0B'), colors.white),      # Orange
-        'medium': (colors.HexColor('#FCD34D'), colors.black),    # Yellow
-        'low': (colors.HexColor('#10B981'), colors.white),       # Green
-    }
-    return severity_colors.get(severity.lower(), (colors.HexColor('#6B7280'), colors.white))
+    return SEVERITY_DISPLAY_COLORS.get(severity, DEFAULT_SEVERITY_DISPLAY_COLOR)
 
 
 def create_defect_details_table(detections, styles):
     """
     Create professional color-coded table for defect details
 
+    All of a frame's defects go into one table, a card of rows per defect,
+    so ReportLab lays out one flowable per frame instead of three per defect.
+
     Args:
         detections: List of detection dictionaries
         styles: Report styles
@@ -156,27 +314,46 @@ def create_defect_details_table(detections, styles):
 
     # Header for defect details
     header = Paragraph(
-        f"<b>Defects Detected: {len(detections)}</b>",
+        f"Defects Detected: {len(detections)}",
         styles['SubsectionHeader']
     )
     elements.append(header)
     elements.append(Spacer(1, 8))
 
-    # Create individual defect cards
+    data = []
+    style_cmds = [
+        ('LEFTPADDING', (0, 0), (-1, -1), 8),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+    ]
+
     for idx, detection in enumerate(detections, 1):
-        defect_elements = create_defect_card(detection, idx, styles)
-        elements.extend(defect_elements)
+        rows, severity = create_defect_card(detection, idx, styles)
+        top = len(data)
+        data.extend(rows)
+
+        # Shift the card commands down to this card's rows
+        for cmd, (c0, r0), (c1, r1), *args in _CARD_COMMANDS:
+            style_cmds.append((cmd, (c0, top + r0), (c1, top + r1), *args))
+
+        bg_color, text_color = get_severity_display_color(severity)
+        style_cmds.append(('BACKGROUND', (2, top), (2, top), bg_color))
+        style_cmds.append(('TEXTCOLOR', (2, top), (2, top), text_color))
+
+    # No spacer after the last card
+    data.pop()
+    row_heights = ([None] * (_CARD_ROWS - 1) + [_CARD_SPACER_HEIGHT]) * len(detections)
+    row_heights.pop()
 
-        # Add spacing between defects
-        if idx < len(detections):
-            elements.append(Spacer(1, 10))
+    defects_table = Table(data, colWidths=[1.2 * inch, 3.3 * inch, 1.5 * inch], rowHeights=row_heights)
+    defects_table.setStyle(TableStyle(style_cmds))
+    elements.append(defects_table)
 
     return elements
 
 
 def create_defect_card(detection, index, styles):
     """
-    Create a professional card-style display for a single defect
+    Create the table rows of a professional card-style display for a single defect
 
     Args:
         detection: Detection dictionary
@@ -184,92 +361,31 @@ def create_defect_card(detection, index, styles):
         styles: Report styles
 
     Returns:
-        List of reportlab elements
+        Tuple of (rows, severity): _CARD_ROWS three-column rows laid out as
+        _CARD_COMMANDS expects, and the lowercase severity for the badge
     """
-    elements = []
-
     # Extract detection info
     defect_type = detection.get('detected_object', 'Unknown Defect')
-    severity = detection.get('severity', 'medium')
+    severity = detection.get('severity', 'medium').lower()
     confidence = detection.get('confidence_score', 0)
     location = detection.get('location', 'Not specified')
     description = detection.get('description', 'No description available')
 
-    # Get colors for severity
-    bg_color, text_color = get_severity_display_color(severity)
-
-    # Create defect header table with colored severity badge
-    header_data = [
+    rows = [
+        # Header with colored severity badge
         [
-            Paragraph(f"<b>{index}. {defect_type.upper()}</b>", styles['CustomNormal']),
-            Paragraph(
-                f"<font color='white'><b>{severity.upper()}</b></font>",
-                styles['CustomNormal']
-            )
-        ]
+            Paragraph(f"{index}. {defect_type.upper()}", styles['BoldNormal']),
+            '',
+            Paragraph(severity.upper(), styles['SeverityBadge'])
+        ],
+        ['Location:', location, ''],
+        ['Confidence:', f'{confidence:.1f}%', ''],
+        # Description box
+        [Paragraph(f"<b>Description:</b> {description}", styles['DefectDescription']), '', ''],
+        ['', '', ''],
     ]
 
-    header_table = Table(header_data, colWidths=[4.5 * inch, 1.5 * inch])
-    header_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#F3F4F6')),
-        ('BACKGROUND', (1, 0), (1, 0), bg_color),
-        ('TEXTCOLOR', (0, 0), (0, 0), colors.HexColor('#1F2937')),
-        ('TEXTCOLOR', (1, 0), (1, 0), text_color),
-        ('ALIGN', (1, 0), (1, 0), 'CENTER'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-    ]))
-
-    elements.append(header_table)
-
-    # Create details table
-    details_data = [
-        ['Location:', location],
-        ['Confidence:', f'{confidence:.1f}%'],
-    ]
-
-    details_table = Table(details_data, colWidths=[1.2 * inch, 4.8 * inch])
-    details_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F9FAFB')),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#6B7280')),
-        ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#1F2937')),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ('TOPPADDING', (0, 0), (-1, -1), 4),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#E5E7EB')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-
-    elements.append(details_table)
-
-    # Add description in a bordered box
-    description_data = [[Paragraph(f"<b>Description:</b> {description}", styles['DefectDescription'])]]
-
-    description_table = Table(description_data, colWidths=[6 * inch])
-    description_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#FFFBEB')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#78350F')),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#FDE68A')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-    ]))
-
-    elements.append(description_table)
-
-    return elements
+    return rows, severity
 
 
 def generate_video_pdf_report(
@@ -348,15 +464,7 @@ def generate_video_pdf_report(
     ]
 
     prop_table = Table(property_details, colWidths=[2 * inch, 3.5 * inch])
-    prop_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#E8F4FF')),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#0080FF')),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('PADDING', (0, 0), (-1, -1), 8),
-    ]))
+    prop_table.setStyle(_PROPERTY_TABLE_STYLE)
     story.append(prop_table)
     story.append(Spacer(1, 20))
 
@@ -368,25 +476,15 @@ def generate_video_pdf_report(
         story.append(Paragraph("Video Information", styles['SectionHeader']))
         story.append(Spacer(1, 10))
 
-        duration_min = int(video_info.get('duration', 0) // 60)
-        duration_sec = int(video_info.get('duration', 0) % 60)
-
         video_details = [
-            ["Duration", f"{duration_min}:{duration_sec:02d}"],
+            ["Duration", format_timestamp(video_info.get('duration', 0))],
             ["Resolution", f"{video_info.get('width', 0)}x{video_info.get('height', 0)}"],
             ["Frame Rate", f"{video_info.get('fps', 0):.1f} fps"],
             ["Total Frames", str(video_info.get('total_frames', 0))],
         ]
 
         video_table = Table(video_details, colWidths=[2 * inch, 3.5 * inch])
-        video_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F8FF')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#CCCCCC')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('PADDING', (0, 0), (-1, -1), 8),
-        ]))
+        video_table.setStyle(_VIDEO_TABLE_STYLE)
         story.append(video_table)
         story.append(Spacer(1, 20))
 
@@ -406,16 +504,7 @@ def generate_video_pdf_report(
         ]
 
         summary_table = Table(summary_data, colWidths=[3 * inch, 2.5 * inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#F0F8FF')),
-            ('BACKGROUND', (1, 0), (1, 0), colors.HexColor('#00F5FF')),
-            ('TEXTCOLOR', (1, 0), (1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('PADDING', (0, 0), (-1, -1), 10),
-        ]))
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
         story.append(summary_table)
         story.append(Spacer(1, 20))
 
@@ -428,27 +517,41 @@ def generate_video_pdf_report(
         story.append(Paragraph("Key Frame Analysis", styles['SectionHeader']))
         story.append(Spacer(1, 10))
 
-        for idx, (frame_img, timestamp, detections) in enumerate(key_frames[:10], 1):
-            # Annotate the frame image (just the visual annotations, no legend)
+        def prepare_frame(key_frame):
+            frame_img, _, detections = key_frame
+
+            # Annotate the frame image (just the visual annotations, no legend);
+            # frames without detections get the "No Major Defects" watermark
             annotated_img, _ = annotate_image_with_defects(frame_img, detections, language)
 
             # Create thumbnail
             img_thumbnail = create_thumbnail(annotated_img, max_size=(600, 400))
 
+            # JPEG bytes are embedded in the PDF as-is (DCTDecode), so the frame
+            # is encoded once instead of PNG-encoded, decoded and recompressed
             img_buffer = io.BytesIO()
-            img_thumbnail.save(img_buffer, format='PNG')
+            img_thumbnail.convert('RGB').save(img_buffer, format='JPEG', quality=85, optimize=True)
             img_buffer.seek(0)
+            return img_buffer
 
-            rl_img = RLImage(img_buffer, width=6.5 * inch, height=4 * inch, kind='proportional')
+        # Spend the 10 report slots on the frames with the most detections,
+        # shown in video order; a clean video still gets its first 3 frames
+        ranked = sorted(key_frames, key=lambda key_frame: len(key_frame[2]), reverse=True)
+        report_frames = [key_frame for key_frame in ranked if key_frame[2]][:10] or ranked[:3]
+        report_frames.sort(key=lambda key_frame: key_frame[1])
+
+        # PIL releases the GIL while drawing, resizing and encoding, so frames
+        # are prepared concurrently; the story itself is built sequentially
+        with ThreadPoolExecutor(max_workers=len(report_frames)) as executor:
+            frame_buffers = list(executor.map(prepare_frame, report_frames))
 
-            # Format timestamp
-            time_min = int(timestamp // 60)
-            time_sec = int(timestamp % 60)
-            time_formatted = f"{time_min}:{time_sec:02d}"
+        for idx, ((frame_img, timestamp, detections), img_buffer) in enumerate(
+                zip(report_frames, frame_buffers), 1):
+            rl_img = RLImage(img_buffer, width=6.5 * inch, height=4 * inch, kind='proportional')
 
             # Frame caption
             caption = Paragraph(
-                f"<b>Frame {idx} - Timestamp: {time_formatted}</b>",
+                f"Frame {idx} - Timestamp: {format_timestamp(timestamp)}",
                 styles['SubsectionHeader']
             )
 
@@ -466,6 +569,11 @@ def generate_video_pdf_report(
             # Page break after each frame analysis
             story.append(PageBreak())
 
+        # doc.build() removes each flowable from the story once it is laid
+        # out; with no other reference left, each frame's image buffer is
+        # freed as soon as its page is written rather than at the end
+        del frame_buffers
+
     # ==========================================
     # DEFECT TIMELINE
     # ==========================================
@@ -476,42 +584,34 @@ def generate_video_pdf_report(
 
         timeline = video_analysis.get('defect_timeline', {})
 
-        for defect_type, info in list(timeline.items())[:10]:
-            severity = info.get('severity', 'medium')
-            bg_color, text_color = get_severity_display_color(severity)
+        timeline_data = [_TIMELINE_COLUMNS]
+        timeline_style = list(_TIMELINE_TABLE_STYLE)
+
+        for row, (defect_type, info) in enumerate(list(timeline.items())[:10], 1):
+            severity = info.get('severity', 'medium').lower()
 
-            # Create timeline entry
-            timeline_data = [[
-                Paragraph(f"<b>{defect_type.upper()}</b>", styles['CustomNormal']),
-                Paragraph(f"<b>{severity.upper()}</b>", styles['CustomNormal'])
-            ]]
-
-            timeline_header = Table(timeline_data, colWidths=[4.5 * inch, 1.5 * inch])
-            timeline_header.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#F3F4F6')),
-                ('BACKGROUND', (1, 0), (1, 0), bg_color),
-                ('TEXTCOLOR', (0, 0), (0, 0), colors.HexColor('#1F2937')),
-                ('TEXTCOLOR', (1, 0), (1, 0), text_color),
-                ('ALIGN', (1, 0), (1, 0), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('PADDING', (0, 0), (-1, -1), 6),
-                ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-            ]))
-
-            story.append(timeline_header)
-
-            # Timeline details
-            details_text = f"""
-            Detected: <b>{info.get('frame_count', 0)} times</b> | 
-            Average Confidence: <b>{info.get('avg_confidence', 0):.1f}%</b><br/>
-            First seen: {format_timestamp(info.get('first_seen', 0))} | 
-            Last seen: {format_timestamp(info.get('last_seen', 0))}
-            """
-
-            story.append(Paragraph(details_text, styles['CustomNormal']))
-            story.append(Spacer(1, 12))
+            timeline_data.append([
+                Paragraph(defect_type.upper(), styles['BoldNormal']),
+                severity.upper(),
+                f"{info.get('frame_count', 0)} times",
+                f"{info.get('avg_confidence', 0):.1f}%",
+                format_timestamp(info.get('first_seen', 0)),
+                format_timestamp(info.get('last_seen', 0)),
+            ])
+
+            bg_color, text_color = get_severity_display_color(severity)
+            timeline_style.append(('BACKGROUND', (1, row), (1, row), bg_color))
+            timeline_style.append(('TEXTCOLOR', (1, row), (1, row), text_color))
+
+        # One table for the whole timeline instead of a table and a
+        # paragraph per defect type
+        timeline_table = Table(
+            timeline_data,
+            colWidths=[1.9 * inch, 0.9 * inch, 0.7 * inch, 1.0 * inch, 0.75 * inch, 0.75 * inch],
+            repeatRows=1
+        )
+        timeline_table.setStyle(TableStyle(timeline_style))
+        story.append(timeline_table)
 
     # ==========================================
     # RECOMMENDATIONS
@@ -552,6 +652,5 @@ def generate_video_pdf_report(
 
 def format_timestamp(seconds):
     """Format seconds to MM:SS"""
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
+    minutes, secs = divmod(int(seconds), 60)
     return f"{minutes}:{secs:02d}"
\ No newline at end of file
@@ -9,14 +9,239 @@ from PIL import Image
 import io
 import tempfile
 import os
-from typing import List, Dict, Tuple
+import shutil
+import threading
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from multiprocessing import Pool, shared_memory
+from typing import Dict, Iterator, List, Tuple
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+# decord fetches a batch of frames by index in one call and returns RGB
+try:
+    from decord import VideoReader, cpu
+
+    DECORD_AVAILABLE = True
+except ImportError:
+    DECORD_AVAILABLE = False
+
+# NVDEC decoding needs an OpenCV build with CUDA and the cudacodec module
+try:
+    CUDA_DECODE_AVAILABLE = hasattr(cv2, 'cudacodec') and cv2.cuda.getCudaEnabledDeviceCount() > 0
+except cv2.error:
+    CUDA_DECODE_AVAILABLE = False
+
+
+# Gap in frames beyond which extract_frames seeks instead of reading through;
+# roughly the keyframe interval of typical H.264 encodes
+SEEK_THRESHOLD = 250
+
+# Frames fetched per decord call when frames are streamed with iter_frames
+DECORD_BATCH_SIZE = 16
+
+# JPEG quality of the frames handed to the AI analyzers
+ANALYSIS_JPEG_QUALITY = 85
+
+
+def _open_capture(video_path: str) -> Tuple[cv2.VideoCapture, Dict]:
+    """
+    Open a video and read its metadata from the same capture
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Tuple (open cv2.VideoCapture, video information dictionary)
+    """
+    cap = cv2.VideoCapture(video_path)
+
+    if not cap.isOpened():
+        raise ValueError("Failed to open video file")
+
+    info = {
+        'total_frames': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
+        'fps': cap.get(cv2.CAP_PROP_FPS),
+        'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        'duration': 0,
+        'format': os.path.splitext(video_path)[1][1:].upper()
+    }
+
+    # Calculate duration
+    if info['fps'] > 0:
+        info['duration'] = info['total_frames'] / info['fps']
+
+    return cap, info
+
+
+def _encode_frame(frame_rgb: np.ndarray) -> bytes:
+    """
+    Encode an RGB frame as JPEG bytes for the AI analyzers
+    """
+    # OpenCV's encoder takes BGR; the swap and encode together are still
+    # cheaper than wrapping the frame in a PIL Image and saving that
+    frame_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
+    ok, encoded = cv2.imencode('.jpg', frame_bgr, [cv2.IMWRITE_JPEG_QUALITY, ANALYSIS_JPEG_QUALITY])
+
+    if not ok:
+        raise ValueError("Failed to encode frame")
+
+    return encoded.tobytes()
+
+
+def _file_version(video_path: str) -> Tuple[float, int]:
+    """
+    (modification time, size) of a file, to key caches that must miss when
+    the file at a path is replaced
+    """
+    stat = os.stat(video_path)
+    return stat.st_mtime, stat.st_size
+
+
+# Streamlit reruns the script on every interaction; metadata and thumbnails
+# are cached per file version so reruns don't reopen the video
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_video_info(video_path: str, mtime: float, size: int) -> Dict:
+    cap, info = _open_capture(video_path)
+    cap.release()
+
+    return info
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_video_thumbnail(video_path: str, mtime: float, size: int, timestamp: float) -> Image.Image:
+    cap, info = _open_capture(video_path)
+
+    fps = info['fps']
+    frame_number = int(timestamp * fps)
+
+    # Seek to frame
+    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+
+    ret, frame = cap.read()
+    cap.release()
+
+    if not ret:
+        raise ValueError("Failed to read frame")
+
+    # Convert BGR to RGB
+    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    # Convert to PIL Image
+    pil_image = Image.fromarray(frame_rgb)
+
+    # Create thumbnail
+    pil_image.thumbnail((400, 300), Image.Resampling.LANCZOS)
+
+    return pil_image
+
+
+def _skip_to(cap, position: int, frame_number: int, seek=True):
+    """
+    Move cap so that its next read() returns frame_number
+
+    Args:
+        cap: Open cv2.VideoCapture
+        position: Index of the frame the next read() would return
+        frame_number: Index of the frame wanted next
+        seek: Whether seeking may be used; without it frames are only grabbed
+    """
+    gap = frame_number - position
+
+    if seek and gap > SEEK_THRESHOLD:
+        # Far ahead: one seek beats decoding every frame in between
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+    else:
+        # Close by: stepping forward is cheaper than a seek, which decodes
+        # forward from the previous keyframe anyway. grab() advances without
+        # converting the skipped frame into a BGR image
+        for _ in range(gap):
+            if not cap.grab():
+                break
+
+
+def _scaled_size(width: int, height: int, max_dim):
+    """
+    Size (width, height) that fits a frame within max_dim, or None if it already fits
+    """
+    if not max_dim or max(width, height) <= max_dim:
+        return None
+
+    scale = max_dim / max(width, height)
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def _to_rgb(frame: np.ndarray, size, dst: np.ndarray, scratch=None) -> np.ndarray:
+    """
+    Convert a decoded BGR frame to RGB in dst (a new array if dst is None),
+    downscaling it to size if given; scratch is an optional reusable array
+    of the downscaled size for the intermediate BGR frame
+    """
+    if size is None:
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=dst)
+
+    # Resizing works per channel, so shrinking first leaves the channel swap
+    # only the small frame to touch; INTER_AREA is the best filter for shrinking
+    frame_small = cv2.resize(frame, size, dst=scratch, interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(frame_small, cv2.COLOR_BGR2RGB, dst=dst)
+
+
+def _decode_chunk(args) -> int:
+    """
+    Decode one contiguous chunk of target frames into shared memory
+
+    Runs in a worker process of VideoProcessor.extract_frames_parallel.
+
+    Args:
+        args: Tuple (video_path, shm_name, shape, frame_numbers, offset, size);
+            RGB frames, downscaled to size if given, are written to rows
+            offset.. of the shared (N, H, W, 3) array
+
+    Returns:
+        Number of frames decoded (fewer than requested if the video ends early)
+    """
+    video_path, shm_name, shape, frame_numbers, offset, size = args
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        frames_rgb = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        cap = cv2.VideoCapture(video_path)
+
+        # Seek once to the chunk start, then read forward
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_numbers[0])
+        position = frame_numbers[0]
+        decoded = 0
+
+        # Decode and resize buffers reused for every frame
+        frame = None
+        scratch = np.empty(shape[1:], dtype=np.uint8) if size is not None else None
+
+        for frame_number in frame_numbers:
+            _skip_to(cap, position, frame_number)
+
+            ret, frame = cap.read(frame)
+
+            if not ret or (size is None and frame.shape != shape[1:]):
+                break
+
+            position = frame_number + 1
+            _to_rgb(frame, size, frames_rgb[offset + decoded], scratch)
+            decoded += 1
+
+        cap.release()
+        del frames_rgb
+        return decoded
+    finally:
+        shm.close()
 
 
 class VideoProcessor:
     """Process videos for property inspection defect detection"""
 
-    def __init__(self, frame_interval=30, max_frames=100, min_frames=10):
+    def __init__(self, frame_interval=30, max_frames=100, min_frames=10, target_max_dim=768):
         """
         Initialize video processor
 
@@ -24,67 +249,118 @@ class VideoProcessor:
             frame_interval: Extract 1 frame every N frames (default: 30 = ~1 frame/sec for 30fps video)
             max_frames: Maximum number of frames to extract
             min_frames: Minimum number of frames to extract
+            target_max_dim: Longest side of extracted frames in pixels; larger
+                frames are downscaled right after decoding (None keeps full size)
         """
         self.frame_interval = frame_interval
         self.max_frames = max_frames
         self.min_frames = min_frames
+        self.target_max_dim = target_max_dim
 
-    def extract_frames(self, video_path: str, progress_callback=None) -> List[Tuple[Image.Image, float, int]]:
+    def extract_frames(self, video_path: str, progress_callback=None) -> List[Tuple[np.ndarray, float, int]]:
         """
         Extract frames from video at regular intervals
 
+        Frames are returned as RGB uint8 arrays, views into one array allocated
+        for all frames; wrap them with Image.fromarray where a PIL Image is needed.
+
         Args:
             video_path: Path to video file
             progress_callback: Optional callback function for progress updates
 
         Returns:
-            List of tuples (PIL Image, timestamp in seconds, frame number)
+            List of tuples (RGB frame array, timestamp in seconds, frame number)
         """
-        frames = []
+        if CUDA_DECODE_AVAILABLE:
+            return list(self._iter_frames_cuda(video_path, progress_callback, single_buffer=True))
 
-        try:
-            # Open video
-            cap = cv2.VideoCapture(video_path)
+        if DECORD_AVAILABLE:
+            return list(self._iter_frames_decord(video_path, progress_callback))
+
+        return list(self._iter_frames_cv2(video_path, progress_callback, single_buffer=True))
+
+    def iter_frames(self, video_path: str, progress_callback=None) -> Iterator[Tuple[np.ndarray, float, int]]:
+        """
+        Yield the frames extract_frames returns, one at a time as they are decoded
+
+        Each frame gets its own array, so only the frames the caller still
+        holds stay in memory.
+
+        Args:
+            video_path: Path to video file
+            progress_callback: Optional callback function for progress updates
 
-            if not cap.isOpened():
-                raise ValueError("Failed to open video file")
+        Yields:
+            Tuples (RGB frame array, timestamp in seconds, frame number)
+        """
+        if CUDA_DECODE_AVAILABLE:
+            return self._iter_frames_cuda(video_path, progress_callback, single_buffer=False)
 
-            # Get video properties
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            duration = total_frames / fps if fps > 0 else 0
+        if DECORD_AVAILABLE:
+            return self._iter_frames_decord(video_path, progress_callback, batch_size=DECORD_BATCH_SIZE)
 
-            # Calculate frame interval based on video duration
-            if total_frames < self.min_frames * self.frame_interval:
-                # For short videos, extract more frames
-                frame_interval = max(1, total_frames // self.min_frames)
-            else:
-                frame_interval = self.frame_interval
+        return self._iter_frames_cv2(video_path, progress_callback, single_buffer=False)
 
-            # Limit maximum frames
-            expected_frames = min(total_frames // frame_interval, self.max_frames)
+    def _iter_frames_cv2(self, video_path: str, progress_callback=None,
+                         single_buffer=False) -> Iterator[Tuple[np.ndarray, float, int]]:
+        """
+        Decode the target frames with OpenCV
 
-            frame_count = 0
+        With single_buffer, frames are written into one array allocated for all
+        of them; otherwise each frame is allocated separately.
+        """
+        try:
+            # Open video and get its properties
+            cap, info = _open_capture(video_path)
+            total_frames = info['total_frames']
+            fps = info['fps']
+
+            # Only the frames that are kept get decoded
+            target_frames = self._target_frames(total_frames)
+            expected_frames = len(target_frames)
+
+            position = 0  # index of the next frame cap.read() returns
+            frames_rgb = None
+            size = None
             extracted_count = 0
 
-            while cap.isOpened() and extracted_count < self.max_frames:
-                ret, frame = cap.read()
+            # Decode and resize buffers reused for every frame
+            frame = None
+            scratch = None
 
-                if not ret:
-                    break
+            # Seeking needs a reliable frame count; without one, step
+            # through the stream and stop at the first failed read
+            seek = total_frames > 0
+
+            try:
+                for frame_number in target_frames:
+                    _skip_to(cap, position, frame_number, seek)
+
+                    ret, frame = cap.read(frame)
+
+                    if not ret:
+                        break
+
+                    position = frame_number + 1
+
+                    if extracted_count == 0:
+                        height, width = frame.shape[:2]
+                        size = _scaled_size(width, height, self.target_max_dim)
+                        if size is not None:
+                            width, height = size
+                            scratch = np.empty((height, width, 3), dtype=np.uint8)
 
-                # Extract frame at intervals
-                if frame_count % frame_interval == 0:
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                        # One buffer for all frames, sized from the first decoded frame
+                        if single_buffer:
+                            frames_rgb = np.empty((expected_frames, height, width, 3), dtype=np.uint8)
 
-                    # Convert to PIL Image
-                    pil_image = Image.fromarray(frame_rgb)
+                    # Convert BGR to RGB, straight into the frame's slot if there is one
+                    dst = frames_rgb[extracted_count] if frames_rgb is not None else None
+                    frame_rgb = _to_rgb(frame, size, dst, scratch)
 
                     # Calculate timestamp
-                    timestamp = frame_count / fps if fps > 0 else 0
+                    timestamp = frame_number / fps if fps > 0 else 0
 
-                    frames.append((pil_image, timestamp, frame_count))
                     extracted_count += 1
 
                     # Progress callback
@@ -92,15 +368,222 @@ class VideoProcessor:
                         progress = extracted_count / expected_frames
                         progress_callback(min(progress, 1.0))
 
-                frame_count += 1
+                    yield frame_rgb, timestamp, frame_number
+            finally:
+                cap.release()
 
+        except Exception as e:
+            raise Exception(f"Error extracting frames: {str(e)}")
+
+    def _iter_frames_cuda(self, video_path: str, progress_callback=None,
+                          single_buffer=False) -> Iterator[Tuple[np.ndarray, float, int]]:
+        """
+        Decode the target frames on the GPU with cv2.cudacodec
+
+        Skipped frames are only grabbed; kept frames are converted and resized
+        on the GPU, so just the small RGB frames are downloaded. Falls back to
+        the OpenCV CPU decoder if the GPU reader cannot open the video.
+        """
+        try:
+            cap, info = _open_capture(video_path)
             cap.release()
+            total_frames = info['total_frames']
+            fps = info['fps']
+
+            try:
+                reader = cv2.cudacodec.createVideoReader(video_path)
+            except cv2.error:
+                yield from self._iter_frames_cv2(video_path, progress_callback, single_buffer)
+                return
+
+            target_frames = self._target_frames(total_frames)
+            expected_frames = len(target_frames)
+
+            position = 0  # index of the next frame the reader returns
+            frames_rgb = None
+            size = None
+            extracted_count = 0
+
+            for frame_number in target_frames:
+                # NVDEC decodes forward only, so skipped frames are grabbed
+                while position < frame_number and reader.grab():
+                    position += 1
+
+                ret, gpu_frame = reader.nextFrame()
+
+                if not ret:
+                    break
+
+                position = frame_number + 1
+
+                # The reader returns BGRA frames
+                gpu_rgb = cv2.cuda.cvtColor(gpu_frame, cv2.COLOR_BGRA2RGB)
+
+                if extracted_count == 0:
+                    width, height = gpu_rgb.size()
+                    size = _scaled_size(width, height, self.target_max_dim)
+                    if size is not None:
+                        width, height = size
+
+                    # One buffer for all frames, sized from the first decoded frame
+                    if single_buffer:
+                        frames_rgb = np.empty((expected_frames, height, width, 3), dtype=np.uint8)
+
+                if size is not None:
+                    gpu_rgb = cv2.cuda.resize(gpu_rgb, size, interpolation=cv2.INTER_AREA)
+
+                # Download straight into the frame's slot if there is one
+                if frames_rgb is not None:
+                    frame_rgb = gpu_rgb.download(frames_rgb[extracted_count])
+                else:
+                    frame_rgb = gpu_rgb.download()
+
+                # Calculate timestamp
+                timestamp = frame_number / fps if fps > 0 else 0
+
+                extracted_count += 1
+
+                # Progress callback
+                if progress_callback:
+                    progress = extracted_count / expected_frames
+                    progress_callback(min(progress, 1.0))
+
+                yield frame_rgb, timestamp, frame_number
+
+        except Exception as e:
+            raise Exception(f"Error extracting frames: {str(e)}")
+
+    def _iter_frames_decord(self, video_path: str, progress_callback=None,
+                            batch_size=None) -> Iterator[Tuple[np.ndarray, float, int]]:
+        """
+        Decode the target frames with decord, fetched batch_size at a time
+        (all in one call by default), already in RGB
+        """
+        try:
+            vr = VideoReader(video_path, ctx=cpu(0), num_threads=4)
+
+            # decord resizes while decoding when given the output size
+            height, width = vr[0].shape[:2]
+            size = _scaled_size(width, height, self.target_max_dim)
+            if size is not None:
+                vr = VideoReader(video_path, ctx=cpu(0), num_threads=4, width=size[0], height=size[1])
+
+            fps = vr.get_avg_fps()
+
+            target_frames = list(self._target_frames(len(vr)))
+            batch_size = batch_size or len(target_frames)
+
+            for start in range(0, len(target_frames), batch_size):
+                frame_numbers = target_frames[start:start + batch_size]
+                batch = vr.get_batch(frame_numbers).asnumpy()
+
+                if progress_callback:
+                    progress_callback((start + len(frame_numbers)) / len(target_frames))
+
+                for frame_rgb, frame_number in zip(batch, frame_numbers):
+                    yield frame_rgb, frame_number / fps if fps > 0 else 0, frame_number
+
+        except Exception as e:
+            raise Exception(f"Error extracting frames: {str(e)}")
+
+    def extract_frames_parallel(self, video_path: str, workers=None,
+                                progress_callback=None) -> List[Tuple[np.ndarray, float, int]]:
+        """
+        Extract the same frames as extract_frames, decoding in several processes
+
+        The target frames are split into one contiguous chunk per worker; each
+        worker opens its own capture, seeks to its chunk and writes RGB frames
+        into a shared array, so no frame data is pickled between processes.
+
+        Args:
+            video_path: Path to video file
+            workers: Number of worker processes (default: CPU count)
+            progress_callback: Optional callback function for progress updates
+
+        Returns:
+            List of tuples (RGB frame array, timestamp in seconds, frame number)
+        """
+        try:
+            cap, info = _open_capture(video_path)
+            cap.release()
+            total_frames = info['total_frames']
+            fps = info['fps']
+            height = info['height']
+            width = info['width']
+
+            # Chunks can only be split up for a known frame count and size
+            if total_frames <= 0 or width <= 0 or height <= 0:
+                return self.extract_frames(video_path, progress_callback)
+
+            target_frames = self._target_frames(total_frames)
+
+            if not target_frames:
+                return []
+
+            workers = max(1, min(workers or os.cpu_count() or 1, len(target_frames)))
+            chunk_size = -(-len(target_frames) // workers)
+            chunks = [target_frames[start:start + chunk_size]
+                      for start in range(0, len(target_frames), chunk_size)]
+
+            size = _scaled_size(width, height, self.target_max_dim)
+            if size is not None:
+                width, height = size
+
+            shape = (len(target_frames), height, width, 3)
+            shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+            try:
+                tasks = [(video_path, shm.name, shape, chunk, idx * chunk_size, size)
+                         for idx, chunk in enumerate(chunks)]
+
+                decoded_counts = []
+                with Pool(len(chunks)) as pool:
+                    for decoded in pool.imap(_decode_chunk, tasks):
+                        decoded_counts.append(decoded)
+                        if progress_callback:
+                            progress_callback(len(decoded_counts) / len(chunks))
+
+                # Copy out of shared memory before it is released
+                frames_rgb = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf).copy()
+            finally:
+                shm.close()
+                shm.unlink()
+
+            # Keep frames up to the first chunk that stopped short, like the
+            # sequential reader stopping at the first failed read
+            frames = []
+            for idx, (chunk, decoded) in enumerate(zip(chunks, decoded_counts)):
+                offset = idx * chunk_size
+                for i in range(decoded):
+                    frame_number = chunk[i]
+                    timestamp = frame_number / fps if fps > 0 else 0
+                    frames.append((frames_rgb[offset + i], timestamp, frame_number))
+                if decoded < len(chunk):
+                    break
 
             return frames
 
         except Exception as e:
             raise Exception(f"Error extracting frames: {str(e)}")
 
+    def _target_frames(self, total_frames: int) -> range:
+        """
+        Frame numbers to extract from a video with total_frames frames
+        """
+        if total_frames <= 0:
+            # Frame count unknown (some containers, e.g. browser-recorded
+            # WebM, report 0 or less): sample at the default interval and let
+            # the decoder stop at the end of the stream
+            return range(0, self.frame_interval * self.max_frames, self.frame_interval)
+
+        # Calculate frame interval based on video duration
+        if total_frames < self.min_frames * self.frame_interval:
+            # For short videos, extract more frames
+            frame_interval = max(1, total_frames // self.min_frames)
+        else:
+            frame_interval = self.frame_interval
+
+        return range(0, total_frames, frame_interval)[:self.max_frames]
+
     def get_video_info(self, video_path: str) -> Dict:
         """
         Get video metadata
@@ -112,27 +595,7 @@ class VideoProcessor:
             Dictionary with video information
         """
         try:
-            cap = cv2.VideoCapture(video_path)
-
-            if not cap.isOpened():
-                raise ValueError("Failed to open video file")
-
-            info = {
-                'total_frames': int(cap.get(cv2.CAP_PROP_FRAME_COUNT)),
-                'fps': cap.get(cv2.CAP_PROP_FPS),
-                'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
-                'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
-                'duration': 0,
-                'format': os.path.splitext(video_path)[1][1:].upper()
-            }
-
-            # Calculate duration
-            if info['fps'] > 0:
-                info['duration'] = info['total_frames'] / info['fps']
-
-            cap.release()
-
-            return info
+            return _cached_video_info(video_path, *_file_version(video_path))
 
         except Exception as e:
             raise Exception(f"Error getting video info: {str(e)}")
@@ -149,83 +612,80 @@ class VideoProcessor:
             PIL Image thumbnail
         """
         try:
-            cap = cv2.VideoCapture(video_path)
-
-            if not cap.isOpened():
-                raise ValueError("Failed to open video file")
-
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_number = int(timestamp * fps)
-
-            # Seek to frame
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-
-            ret, frame = cap.read()
-            cap.release()
-
-            if not ret:
-                raise ValueError("Failed to read frame")
-
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # Convert to PIL Image
-            pil_image = Image.fromarray(frame_rgb)
-
-            # Create thumbnail
-            pil_image.thumbnail((400, 300), Image.Resampling.LANCZOS)
-
-            return pil_image
+            return _cached_video_thumbnail(video_path, *_file_version(video_path), timestamp)
 
         except Exception as e:
             raise Exception(f"Error creating thumbnail: {str(e)}")
 
-    def analyze_video_with_ai(self, video_path: str, ai_analyzer, progress_callback=None):
+    def analyze_video_with_ai(self, video_path: str, ai_analyzer, progress_callback=None,
+                              batch_analyzer=None, batch_size: int = 8, max_workers: int = 8,
+                              video_info=None):
         """
         Analyze entire video using AI defect detection
 
         Args:
             video_path: Path to video file
-            ai_analyzer: Function to analyze images (e.g., analyze_image_with_gemini)
+            ai_analyzer: Function to analyze images (e.g., analyze_image_with_gemini);
+                each frame is passed once, already encoded as JPEG bytes
             progress_callback: Optional callback for progress updates
+            batch_analyzer: Optional function analyzing a list of images in one
+                request (e.g., analyze_images_batch_with_gemini), given JPEG
+                bytes like ai_analyzer; used instead of ai_analyzer when given
+            batch_size: Frames per batch_analyzer call
+            max_workers: ai_analyzer or batch_analyzer calls run concurrently;
+                each call waits on the network, so threads overlap the requests
+            video_info: Result of get_video_info for this video, if the caller
+                already has it; saves opening the video an extra time
 
         Returns:
             Dictionary with analysis results
         """
-        # Extract frames
-        frames = self.extract_frames(video_path, progress_callback)
-
-        if not frames:
+        # Frames are decoded as they are analyzed, so only the frames waiting
+        # for a result are held in memory
+        if video_info is None:
+            video_info = self.get_video_info(video_path)
+        expected_frames = len(self._target_frames(video_info['total_frames']))
+        frames = self.iter_frames(video_path)
+
+        if batch_analyzer is not None:
+            # Send frames in groups so each request covers batch_size frames
+            def analyze_group(encoded_frames):
+                return batch_analyzer(encoded_frames)
+        else:
+            batch_size = 1
+
+            def analyze_group(encoded_frames):
+                return [ai_analyzer(encoded_frames[0])]
+
+        results = self._analyze_frames_concurrently(
+            frames, analyze_group, batch_size, max_workers, progress_callback, expected_frames)
+
+        if not results:
             return {
                 'success': False,
                 'error': 'No frames could be extracted from video',
                 'frames_analyzed': 0
             }
 
-        # Analyze each frame
+        # Collect the analysis of each frame
         all_detections = []
         frame_analyses = []
         non_property_frames = 0
 
-        total_frames = len(frames)
-
-        for idx, (frame_image, timestamp, frame_number) in enumerate(frames):
-            if progress_callback:
-                progress_callback((idx + 1) / total_frames)
-
-            # Analyze frame
-            analysis = ai_analyzer(frame_image)
+        for timestamp, frame_number, analysis in results:
 
             # Check if property image
             if not analysis.get('is_property', True):
                 non_property_frames += 1
                 continue
 
+            timestamp_formatted = format_timestamp(timestamp)
+
             # Store frame analysis
             frame_analysis = {
                 'frame_number': frame_number,
                 'timestamp': timestamp,
-                'timestamp_formatted': format_timestamp(timestamp),
+                'timestamp_formatted': timestamp_formatted,
                 'detections': analysis.get('detections', []),
                 'overall_score': analysis.get('overall_condition_score', 0),
                 'usability': analysis.get('usability_rating', 'unknown')
@@ -238,14 +698,14 @@ class VideoProcessor:
                 detection_with_time = detection.copy()
                 detection_with_time['frame_number'] = frame_number
                 detection_with_time['timestamp'] = timestamp
-                detection_with_time['timestamp_formatted'] = format_timestamp(timestamp)
+                detection_with_time['timestamp_formatted'] = timestamp_formatted
                 all_detections.append(detection_with_time)
 
         # Aggregate results
         if not all_detections:
             return {
                 'success': True,
-                'frames_analyzed': len(frames),
+                'frames_analyzed': len(results),
                 'non_property_frames': non_property_frames,
                 'total_defects': 0,
                 'frame_analyses': [],
@@ -254,24 +714,29 @@ class VideoProcessor:
                 'message': 'No defects detected in video'
             }
 
-        # Calculate summary statistics
-        severity_counts = {
-            'critical': len([d for d in all_detections if d.get('severity') == 'critical']),
-            'high': len([d for d in all_detections if d.get('severity') == 'high']),
-            'medium': len([d for d in all_detections if d.get('severity') == 'medium']),
-            'low': len([d for d in all_detections if d.get('severity') == 'low'])
-        }
-
-        # Calculate average condition score
-        scores = [f['overall_score'] for f in frame_analyses if f['overall_score'] > 0]
-        average_score = sum(scores) / len(scores) if scores else 0
+        # Calculate summary statistics in one pass over the detections
+        counts = Counter(d.get('severity') for d in all_detections)
+        severity_counts = {severity: counts[severity] for severity in ('critical', 'high', 'medium', 'low')}
+
+        # Calculate average condition score and count frames with defects
+        # in one pass over the frames
+        score_total = 0
+        scored_frames = 0
+        frames_with_defects = 0
+        for f in frame_analyses:
+            if f['overall_score'] > 0:
+                score_total += f['overall_score']
+                scored_frames += 1
+            if f['detections']:
+                frames_with_defects += 1
+        average_score = score_total / scored_frames if scored_frames else 0
 
         # Group similar defects across frames
         defect_timeline = self._create_defect_timeline(all_detections)
 
         return {
             'success': True,
-            'frames_analyzed': len(frames),
+            'frames_analyzed': len(results),
             'non_property_frames': non_property_frames,
             'property_frames': len(frame_analyses),
             'total_defects': len(all_detections),
@@ -281,60 +746,133 @@ class VideoProcessor:
             'defect_timeline': defect_timeline,
             'defect_summary': severity_counts,
             'average_score': int(average_score),
-            'frames_with_defects': len([f for f in frame_analyses if len(f['detections']) > 0])
+            'frames_with_defects': frames_with_defects
         }
 
+    def _analyze_frames_concurrently(self, frames, analyze_group, group_size, max_workers,
+                                     progress_callback, expected_frames):
+        """
+        Analyze the frames in groups of group_size using a thread pool
+
+        analyze_group receives a group's frames as JPEG bytes and returns one
+        analysis per frame. At most max_workers groups are in flight; the next
+        frames are decoded only when one of them finishes. Progress is reported
+        from the calling thread as groups complete; the worker threads share
+        the Streamlit script context so messages shown by the analyzer still
+        reach the page.
+
+        Returns:
+            List of (timestamp, frame number, analysis) in frame order
+        """
+        ctx = get_script_run_ctx(suppress_warning=True)
+
+        def attach_context():
+            if ctx is not None:
+                add_script_run_ctx(threading.current_thread(), ctx)
+
+        def analyze(group):
+            return analyze_group([_encode_frame(frame_rgb) for frame_rgb, _, _ in group])
+
+        group_results = []  # per group: list of (timestamp, frame number, analysis)
+        in_flight = {}
+        done_count = 0
+
+        def collect(done):
+            nonlocal done_count
+            for future in done:
+                idx = in_flight.pop(future)
+                group_results[idx] = [
+                    (timestamp, frame_number, analysis)
+                    for (timestamp, frame_number, _), analysis in zip(group_results[idx], future.result())
+                ]
+                done_count += len(group_results[idx])
+                if progress_callback:
+                    progress_callback(min(done_count / expected_frames, 1.0))
+
+        def submit(group):
+            if len(in_flight) >= max_workers:
+                collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+
+            in_flight[executor.submit(analyze, group)] = len(group_results)
+            group_results.append([(timestamp, frame_number, None) for _, timestamp, frame_number in group])
+
+        with ThreadPoolExecutor(max_workers=max_workers, initializer=attach_context) as executor:
+            group = []
+            for frame in frames:
+                group.append(frame)
+                if len(group) == group_size:
+                    submit(group)
+                    group = []
+
+            if group:
+                submit(group)
+
+            collect(as_completed(list(in_flight)))
+
+        return [result for results in group_results for result in results]
+
     def _create_defect_timeline(self, detections: List[Dict]) -> Dict:
         """
         Group similar defects across frames to create timeline
 
         Args:
-            detections: List of all detections
+            detections: List of all detections, in frame order as collected
+                by analyze_video_with_ai
 
         Returns:
-            Dictionary grouping similar defects by type
+            Dictionary grouping similar defects by type. Each entry's
+            'occurrences' are stored column-wise, one list per field, so the
+            results held in session state don't carry a dict per detection
         """
         timeline = {}
+        confidence_totals = {}
 
         for detection in detections:
             defect_type = detection.get('detected_object', 'Unknown')
+            timestamp = detection.get('timestamp', 0)
+            confidence = detection.get('confidence_score', 0)
 
             # Normalize defect type name
             defect_key = defect_type.lower().strip()
 
-            if defect_key not in timeline:
-                timeline[defect_key] = {
+            entry = timeline.get(defect_key)
+            if entry is None:
+                entry = timeline[defect_key] = {
                     'defect_type': defect_type,
                     'severity': detection.get('severity', 'medium'),
-                    'occurrences': [],
-                    'first_seen': detection.get('timestamp', 0),
-                    'last_seen': detection.get('timestamp', 0),
+                    'occurrences': {
+                        'timestamp': [],
+                        'timestamp_formatted': [],
+                        'frame_number': [],
+                        'confidence': [],
+                        'location': [],
+                        'description': []
+                    },
+                    'first_seen': timestamp,
+                    'last_seen': timestamp,
                     'frame_count': 0,
                     'avg_confidence': 0
                 }
+                confidence_totals[defect_key] = 0
 
             # Add occurrence
-            timeline[defect_key]['occurrences'].append({
-                'timestamp': detection.get('timestamp', 0),
-                'timestamp_formatted': detection.get('timestamp_formatted', '0:00'),
-                'frame_number': detection.get('frame_number', 0),
-                'confidence': detection.get('confidence_score', 0),
-                'location': detection.get('location', 'Unknown'),
-                'description': detection.get('description', '')
-            })
-
-            # Update stats
-            timeline[defect_key]['last_seen'] = max(
-                timeline[defect_key]['last_seen'],
-                detection.get('timestamp', 0)
-            )
-            timeline[defect_key]['frame_count'] += 1
+            occurrences = entry['occurrences']
+            occurrences['timestamp'].append(timestamp)
+            occurrences['timestamp_formatted'].append(detection.get('timestamp_formatted', '0:00'))
+            occurrences['frame_number'].append(detection.get('frame_number', 0))
+            occurrences['confidence'].append(confidence)
+            occurrences['location'].append(detection.get('location', 'Unknown'))
+            occurrences['description'].append(detection.get('description', ''))
+
+            # Update stats; detections arrive in time order, so the latest
+            # one is always the last seen
+            entry['last_seen'] = timestamp
+            entry['frame_count'] += 1
+            confidence_totals[defect_key] += confidence
 
         # Calculate average confidence for each defect type
-        for defect_key in timeline:
-            occurrences = timeline[defect_key]['occurrences']
-            confidences = [o['confidence'] for o in occurrences]
-            timeline[defect_key]['avg_confidence'] = sum(confidences) / len(confidences) if confidences else 0
+        for defect_key, entry in timeline.items():
+            entry['avg_confidence'] = confidence_totals[defect_key] / entry['frame_count']
 
         return timeline
 
@@ -349,8 +887,13 @@ def format_timestamp(seconds: float) -> str:
     Returns:
         Formatted string (e.g., "1:23" or "12:45")
     """
-    minutes = int(seconds // 60)
-    secs = int(seconds % 60)
+    return _format_whole_seconds(int(seconds))
+
+
+@lru_cache(maxsize=4096)
+def _format_whole_seconds(seconds: int) -> str:
+    # Frames and detections share timestamps, so each second is formatted once
+    minutes, secs = divmod(seconds, 60)
     return f"{minutes}:{secs:02d}"
 
 
@@ -366,11 +909,11 @@ def save_uploaded_video(uploaded_file) -> str:
     """
     # Create temporary file
     suffix = os.path.splitext(uploaded_file.name)[1]
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
 
-    # Write uploaded file to temp file
-    temp_file.write(uploaded_file.read())
-    temp_file.close()
+    # Copy in 1 MiB chunks so the video is never held in memory twice
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+        uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, temp_file, length=1 << 20)
 
     return temp_file.name
 